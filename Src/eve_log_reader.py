@@ -2,20 +2,117 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import re
+import sys
+import array
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import threading
 import time
 import glob
 import hashlib
+import io
+import heapq
+from operator import itemgetter
 import csv
 import requests  # New import for Google Form submission
 import logging  # New import for file logging
 import psutil  # For detecting active EVE processes
 
+# Optional: OS file change notifications for the log directory (falls back to polling)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Configuration and project files that is_recent_file never treats as logs (lowercase, matched
+# against the lowercased filename)
+SKIP_FILE_PATTERNS = (
+    'google_form_config',
+    'version_info',
+    'requirements',
+    'readme',
+    'license',
+    'changelog',
+    'build',
+    'setup',
+    'test',
+    'example',
+    'sample',
+)
+
 # Application version
 APP_VERSION = "0.6.9"
 
+# Seconds between change checks - with a directory watch running the check is still needed at
+# this rate, as a safety net for changes the OS doesn't report promptly (e.g. NTFS holding back
+# notifications for appends to a log the EVE client keeps open)
+MONITOR_POLL_INTERVAL = 1
+
+# Without a directory watch, the poll interval doubles after every IDLE_CHECKS_PER_BACKOFF checks
+# that found nothing, up to MAX_IDLE_MONITOR_POLL_INTERVAL, and drops back on the next change
+IDLE_CHECKS_PER_BACKOFF = 10
+MAX_IDLE_MONITOR_POLL_INTERVAL = 4
+
+# Seconds the change check reuses its list of recent log files before listing the directory
+# again - a directory watch also forces a rescan as soon as a log file appears or goes away
+RECENT_FILES_RESCAN_INTERVAL = 10
+
+# Milliseconds between the monitor seeing a change and the refresh it queues
+AUTO_REFRESH_DELAY_MS = 250
+
+# Write buffer for exports - large exports otherwise issue a write() per 8 KB
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Common EVE log timestamp patterns, tried in order - compiled once and shared by every reader instance
+TIMESTAMP_PATTERNS = [
+    re.compile(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]'),  # [YYYY-MM-DD HH:MM:SS] (exported format)
+    re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'),  # YYYY-MM-DD HH:MM:SS
+    re.compile(r'(\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2})'),  # M/D/YYYY H:MM:SS (handles single digits)
+    re.compile(r'(\d{2}:\d{2}:\d{2})'),  # HH:MM:SS
+]
+# The dated patterns above fused into one alternation. Lines it doesn't match (every EVE game
+# log line - those use "[ YYYY.MM.DD HH:MM:SS ]") can only match the HH:MM:SS pattern
+DATED_TIMESTAMP_RE = re.compile(
+    r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}|\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2}'
+)
+
+# Most parsed timestamps kept by _parse_utc_timestamp before its cache is cleared
+TIMESTAMP_CACHE_SIZE = 4096
+
+# Bounty log entries, tried in order - compiled once and shared by every reader instance
+# Pattern for bounty entries: (bounty) <font size=12><b><color=0xff00aa00>AMOUNT ISK</color> added to next bounty payout
+# Simplified pattern to catch more variations
+# No \s* before the lazy gap (the two could split whitespace every possible way), and the
+# amount must start at the beginning of a digit run instead of being retried at every digit
+# Lowercase and matched against the lowercased line, like the CONCORD patterns - without
+# re.IGNORECASE the leading "(bounty)" literal can use the engine's fast prefix search
+# Each entry is (pattern, needs payout text). The trailing ".*?added to next bounty payout"
+# isn't part of the regex: a second lazy gap made every ISK amount on a line without the
+# payout text rescan to the end of the line. extract_bounty instead stops the match at
+# the last BOUNTY_PAYOUT_TEXT, which is the same condition
+BOUNTY_PAYOUT_TEXT = 'added to next bounty payout'
+BOUNTY_PATTERNS = [
+    (re.compile(r'\(bounty\).*?<color[^>]*>([\d,]+)\s+isk</color>'), True),
+    (re.compile(r'\(bounty\).*?(?<![\d,])([\d,]+)\s+isk'), True),
+    (re.compile(r'\(bounty\).*?(?<![\d,])([\d,]+)\s+isk'), False),
+]
+
+# CONCORD Rogue Analysis Beacon messages, compiled once and shared by every reader instance
+# Patterns are lowercase and matched against the lowercased line - case-insensitive
+# matching without paying for re.IGNORECASE case folding on every character
+# Updated patterns based on actual EVE Online log messages
+# Each gap commits to the first occurrence of the next literal via (?=(.*?X))\1 (an atomic
+# group); chained .* gaps backtracked through every split of a long near-miss line
+# Pattern for link start message - more flexible matching
+CONCORD_LINK_START_RE = re.compile(r'\[concord\](?=(.*?rogue analysis beacon))\1(?=(.*?link))\2.*?established')
+# Pattern for link completion message - more flexible matching
+CONCORD_LINK_COMPLETE_RE = re.compile(r'\[concord\](?=(.*?rogue analysis beacon))\1(?=(.*?link))\2.*?completed')
+# Also check for alternative patterns that might exist
+CONCORD_ALT_LINK_START_RE = re.compile(r'your ship has started the link process with concord rogue analysis beacon')
+CONCORD_ALT_LINK_COMPLETE_RE = re.compile(r'your ship successfully completed the link process with concord rogue analysis beacon')
+
 # OPTION 1 IMPLEMENTATION: Multi-Account Bounty Tracking Fix
 # This version disables restrictive log filtering to ensure ALL EVE account bounties are tracked
 # Previously, the system would exclude log files it thought were "inactive", causing bounties
@@ -25,6 +122,31 @@ APP_VERSION = "0.6.9"
 # Timezone handling: All timestamps are handled in UTC to match EVE Online log format
 # EVE Online logs use UTC timestamps, so we maintain UTC throughout the system
 
+if WATCHDOG_AVAILABLE:
+    class LogDirectoryEventHandler(FileSystemEventHandler):
+        """Wake the monitoring loop whenever a log file in the log directory changes"""
+        
+        def __init__(self, wakeup_event, log_extensions, rescan_event):
+            super().__init__()
+            self.wakeup_event = wakeup_event
+            self.log_extensions = log_extensions
+            self.rescan_event = rescan_event
+        
+        def on_any_event(self, event):
+            # Reads show up as opened/closed-without-write on Linux - including the refresh's own
+            # reads, which would otherwise wake the loop again after every refresh
+            if event.is_directory or event.event_type in ("opened", "closed_no_write"):
+                return
+            
+            # Renames count if either name is a log file
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if os.fsdecode(path).endswith(self.log_extensions):
+                    # New, deleted or renamed log files change the set of files to check
+                    if event.event_type in ("created", "deleted", "moved"):
+                        self.rescan_event.set()
+                    self.wakeup_event.set()
+                    return
+
 class EVELogReader:
     def __init__(self, root):
         self.root = root
@@ -43,14 +165,23 @@ class EVELogReader:
             "*.txt",
             "*.xml"
         ]
+        # Same patterns as suffixes, so str.endswith can check them all in one call
+        self.log_extensions = tuple(pattern.lstrip('*') for pattern in self.log_patterns)
         
         # Store all log entries from recent files only
         self.all_log_entries = []
-        self.last_file_sizes = {}
+        self._displayed_log_entries = []  # Entries currently rendered in text_widget (empty if it shows anything else)
+        self.last_file_stats = {}  # (size, mtime) per log file path for change detection
         self.last_file_hashes = {}  # Store content hashes for change detection
+        self._log_file_cache = {}  # Parsed entries and read offset per log file, so refreshes only parse appended lines
+        self._newest_log_file = None  # (mtime, name) of the newest recent file seen by the last change check
+        self._recent_log_paths = None  # (directory, monotonic scan time, paths) from the change check's last directory scan
+        self._log_files_changed_event = threading.Event()  # Set by the directory watch when log files come or go
         
         # Bounty tracking system
         self.bounty_entries = []  # Store bounty entries with timestamps
+        self.bounty_amounts = array.array('q')  # ISK amount column, parallel to bounty_entries
+        self._bounty_keys = set()  # (timestamp, isk_amount, source_file) of tracked bounties, for O(1) duplicate checks
         self.total_bounty_isk = 0  # Total ISK earned from bounties
         self.bounty_session_start = None  # When bounty tracking started
         
@@ -59,13 +190,20 @@ class EVELogReader:
         self.concord_link_completed = False  # Whether the link process completed
         self.concord_countdown_active = False  # Whether countdown is active
         self.concord_countdown_thread = None  # Thread for countdown timer
-        self.stop_concord_countdown = False  # Flag to stop countdown
+        self._concord_countdown_stop = None  # Stop event of the current countdown thread (each thread gets its own)
+        self._beacon_lock = threading.Lock()  # Guards beacon session state shared with the countdown thread
         self.concord_countdown_color = "#ffff00"  # Default yellow color for countdown
         self.current_beacon_id = None  # Unique Beacon ID for current session
         self.beacon_source_file = None  # Source log file for current beacon
+        self._beacon_id_prefixes = {}  # source file -> parsed Beacon ID prefix (None if unparseable)
+        self._current_beacon_key = None  # (log timestamp, source file) of the current session
+        self._timestamp_date = None  # UTC date last used to complete HH:MM:SS timestamps
+        self._timestamp_date_str = None  # Cached "%Y-%m-%d" string for _timestamp_date
+        self._timestamp_cache = {}  # "YYYY-MM-DD HH:MM:SS" -> parsed UTC datetime (see _parse_utc_timestamp)
         
         # CRAB-specific bounty tracking system
         self.crab_bounty_entries = []  # Store bounty entries during CRAB sessions
+        self.crab_bounty_amounts = array.array('q')  # ISK amount column, parallel to crab_bounty_entries
         self.crab_total_bounty_isk = 0  # Total ISK earned during CRAB sessions
         self.crab_session_active = False  # Whether a CRAB session is currently active
         
@@ -726,7 +864,7 @@ class EVELogReader:
         
         # High-frequency monitoring checkbox
         self.high_freq_var = tk.BooleanVar(value=True)
-        high_freq_cb = ttk.Checkbutton(control_frame, text="High-frequency monitoring (1s)", 
+        high_freq_cb = ttk.Checkbutton(control_frame, text=f"High-frequency monitoring ({MONITOR_POLL_INTERVAL}s, up to {MAX_IDLE_MONITOR_POLL_INTERVAL}s when idle)", 
                                       variable=self.high_freq_var, command=self.toggle_high_frequency)
         high_freq_cb.grid(row=0, column=0, padx=(0, 20))
         
@@ -813,6 +951,9 @@ class EVELogReader:
         self.last_refresh_time = None
         self.monitoring_thread = None
         self.stop_monitoring_only = False
+        self._log_change_event = threading.Event()  # Set by the directory watch (or a stop) to wake the monitoring loop
+        self._auto_refresh_pending = False  # A monitoring refresh is queued on the UI thread and hasn't started yet
+        self._status_update_pending = False  # Same for the monitoring loop's status bar update
     
     def browse_directory(self):
         """Browse for log directory"""
@@ -852,28 +993,18 @@ class EVELogReader:
         
         return None, None
     
-    def is_recent_file(self, file_path):
+    def is_recent_file(self, file_path, current_time=None):
         """Check if a file is recent based on filename timestamp"""
-        filename = os.path.basename(file_path)
+        # Callers checking a batch of files pass one current_time instead of a clock read per file
+        if current_time is None:
+            current_time = self.get_utc_now()
         
-        # Skip configuration and project files
-        skip_patterns = [
-            'google_form_config',
-            'version_info',
-            'requirements',
-            'README',
-            'LICENSE',
-            'CHANGELOG',
-            'build',
-            'setup',
-            'test',
-            'example',
-            'sample'
-        ]
+        filename = os.path.basename(file_path)
         
         # Check if this is a configuration/project file that should be skipped
-        for pattern in skip_patterns:
-            if pattern.lower() in filename.lower():
+        lowered_name = filename.lower()
+        for pattern in SKIP_FILE_PATTERNS:
+            if pattern in lowered_name:
                 return False
         
         # Try to parse timestamp from filename
@@ -881,12 +1012,12 @@ class EVELogReader:
         
         if timestamp:
             # Check if file is within the specified days old
-            days_old = (self.get_utc_now() - timestamp).days
+            days_old = (current_time - timestamp).days
             return days_old <= self.max_days_old
         
         # If no timestamp in filename, this is likely not an EVE log file
         # Only process files that look like they might be EVE logs
-        if filename.endswith('.txt') and not any(pattern.lower() in filename.lower() for pattern in skip_patterns):
+        if filename.endswith('.txt'):
             # For .txt files without timestamps, check if they look like EVE logs
             # by checking if they contain EVE-specific content
             try:
@@ -897,7 +1028,7 @@ class EVELogReader:
                         # This looks like an EVE log, use modification time
                         mtime = os.path.getmtime(file_path)
                         file_time = datetime.fromtimestamp(mtime, tz=timezone.utc)
-                        days_old = (self.get_utc_now() - file_time).days
+                        days_old = (current_time - file_time).days
                         return days_old <= self.max_days_old
             except:
                 pass
@@ -916,36 +1047,6 @@ class EVELogReader:
         except Exception as e:
             self.status_var.set(f"Error loading files: {str(e)}")
     
-    def scan_existing_bounties(self):
-        """Scan existing log entries for bounty entries that may have been missed"""
-        try:
-            print("🔍 Scanning existing log entries for bounties...")
-            bounty_count = 0
-            
-            for timestamp, line, source_file in self.all_log_entries:
-                bounty_amount = self.extract_bounty(line)
-                if bounty_amount and timestamp:
-                    # Check if this bounty is already tracked
-                    bounty_exists = any(
-                        entry['timestamp'] == timestamp and 
-                        entry['isk_amount'] == bounty_amount and 
-                        entry['source_file'] == source_file
-                        for entry in self.bounty_entries
-                    )
-                    
-                    if not bounty_exists:
-                        self.add_bounty_entry(timestamp, bounty_amount, source_file)
-                        bounty_count += 1
-            
-            if bounty_count > 0:
-                print(f"💰 Found {bounty_count} additional bounties in existing logs")
-                self.update_bounty_display()
-            else:
-                print("  No additional bounties found in existing logs")
-                
-        except Exception as e:
-            print(f"Error scanning existing bounties: {e}")
-    
     def scan_for_active_crab_beacons(self):
         """Scan existing log entries for active CRAB beacons and auto-start tracking if recent"""
         try:
@@ -1043,15 +1144,18 @@ class EVELogReader:
                             print(f"⚠️ Warning: Most recent beacon timestamp {beacon_timestamp} is in the future, using current time instead")
                             beacon_timestamp = current_time
                         
+                        # Generate unique Beacon ID
+                        beacon_id = self.generate_beacon_id(source_file, beacon_timestamp)
+                        
                         # Set up beacon tracking
-                        self.concord_link_start = beacon_timestamp
+                        with self._beacon_lock:
+                            self.concord_link_start = beacon_timestamp
+                            self.concord_countdown_active = True
+                            self.concord_link_completed = False
+                            self.current_beacon_id = beacon_id
+                            self.beacon_source_file = source_file
+                            self._current_beacon_key = None
                         self.concord_status_var.set("Status: Linking")
-                        self.concord_countdown_active = True
-                        self.concord_link_completed = False
-                        
-                        # Generate unique Beacon ID
-                        self.current_beacon_id = self.generate_beacon_id(source_file, beacon_timestamp)
-                        self.beacon_source_file = source_file
                         
                         # Start CRAB bounty tracking session
                         self.start_crab_session()
@@ -1078,15 +1182,18 @@ class EVELogReader:
                             print(f"⚠️ Warning: Most recent completed beacon timestamp {beacon_timestamp} is in the future, using current time instead")
                             beacon_timestamp = current_time
                         
+                        # Generate unique Beacon ID
+                        beacon_id = self.generate_beacon_id(source_file, beacon_timestamp)
+                        
                         # Set up completed beacon tracking
-                        self.concord_link_start = beacon_timestamp
-                        self.concord_link_completed = True
+                        with self._beacon_lock:
+                            self.concord_link_start = beacon_timestamp
+                            self.concord_link_completed = True
+                            self.concord_countdown_active = True
+                            self.current_beacon_id = beacon_id
+                            self.beacon_source_file = source_file
+                            self._current_beacon_key = None
                         self.concord_status_var.set("Status: Active")
-                        self.concord_countdown_active = True
-                        
-                        # Generate unique Beacon ID
-                        self.current_beacon_id = self.generate_beacon_id(source_file, beacon_timestamp)
-                        self.beacon_source_file = source_file
                         
                         # Start CRAB bounty tracking session
                         self.start_crab_session()
@@ -1147,30 +1254,25 @@ class EVELogReader:
             # We'll look for messages within a reasonable time window (e.g., 2 hours after start)
             end_window = start_timestamp + timedelta(hours=2)
             
-            # FIRST: Look for link_complete message (if it exists)
-            for timestamp, line, file_name in self.all_log_entries:
-                if file_name == source_file and timestamp and timestamp >= start_timestamp and timestamp <= end_window:
-                    concord_message_type = self.detect_concord_message(line)
-                    if concord_message_type == "link_complete":
-                        print(f"✅ Found link_complete message at {timestamp}")
-                        return timestamp
-            
-            # SECOND: Since there's no link_complete message, look for last bounty message
-            # This indicates when the active combat/bounty collection ended
+            # One pass over the entries: a link_complete message wins outright, otherwise
+            # fall back to the last bounty or combat message (when active combat ended)
             last_bounty_time = None
-            for timestamp, line, file_name in self.all_log_entries:
-                if file_name == source_file and timestamp and timestamp >= start_timestamp and timestamp <= end_window:
-                    if "(bounty)" in line:
-                        last_bounty_time = timestamp
-                        print(f"🔍 Found bounty message at {timestamp}")
-            
-            # THIRD: Look for last combat message (indicates session activity ended)
             last_combat_time = None
             for timestamp, line, file_name in self.all_log_entries:
-                if file_name == source_file and timestamp and timestamp >= start_timestamp and timestamp <= end_window:
-                    if "(combat)" in line:
-                        last_combat_time = timestamp
-                        print(f"🔍 Found combat message at {timestamp}")
+                if file_name != source_file or not timestamp or timestamp < start_timestamp or timestamp > end_window:
+                    continue
+                
+                concord_message_type = self.detect_concord_message(line)
+                if concord_message_type == "link_complete":
+                    print(f"✅ Found link_complete message at {timestamp}")
+                    return timestamp
+                
+                if "(bounty)" in line:
+                    last_bounty_time = timestamp
+                    print(f"🔍 Found bounty message at {timestamp}")
+                if "(combat)" in line:
+                    last_combat_time = timestamp
+                    print(f"🔍 Found combat message at {timestamp}")
             
             # Return the latest of bounty or combat, or None if neither found
             if last_bounty_time and last_combat_time:
@@ -1245,15 +1347,18 @@ class EVELogReader:
                                 print(f"⚠️ Warning: Expired beacon timestamp {beacon_timestamp} is in the future, using current UTC time instead")
                                 beacon_timestamp = current_time
                             
+                            # Generate unique Beacon ID
+                            beacon_id = self.generate_beacon_id(source_file, timestamp)
+                            
                             # Set up expired beacon tracking
-                            self.concord_link_start = beacon_timestamp
+                            with self._beacon_lock:
+                                self.concord_link_start = beacon_timestamp
+                                self.concord_countdown_active = False  # Don't start countdown for expired beacon
+                                self.concord_link_completed = False
+                                self.current_beacon_id = beacon_id
+                                self.beacon_source_file = source_file
+                                self._current_beacon_key = None
                             self.concord_status_var.set("Status: Expired (Tracking)")
-                            self.concord_countdown_active = False  # Don't start countdown for expired beacon
-                            self.concord_link_completed = False
-                            
-                            # Generate unique Beacon ID
-                            self.current_beacon_id = self.generate_beacon_id(source_file, timestamp)
-                            self.beacon_source_file = source_file
                             
                             # Start CRAB bounty tracking session
                             self.start_crab_session()
@@ -1303,7 +1408,7 @@ class EVELogReader:
             self.root.update()
             
             # Check if we have log entries loaded
-            if not hasattr(self, 'all_log_entries') or not self.all_log_entries:
+            if not self.all_log_entries:
                 print("  No log entries loaded yet - skipping startup scan")
                 self.status_var.set("⚠️ No log entries loaded - skipping startup scan")
                 return
@@ -1335,6 +1440,61 @@ class EVELogReader:
             print(f"Error during startup CRAB scan: {e}")
             self.status_var.set(f"❌ Startup scan error: {str(e)}")
     
+    def _process_log_lines(self, lines, source_file):
+        """Parse log lines into (timestamp, line, source_file) entries, tracking bounties and CONCORD messages"""
+        entries = []
+        for line in lines:
+            timestamp = self.extract_timestamp(line)
+            # Lowercased once for both the bounty and the CONCORD checks
+            lowered = line.lower()
+            
+            # Check for bounty entries
+            bounty_amount = self.extract_bounty(line, lowered)
+            if bounty_amount and timestamp:
+                # Check if this bounty is already tracked to avoid duplicates
+                bounty_exists = (timestamp, bounty_amount, source_file) in self._bounty_keys
+                
+                if not bounty_exists:
+                    print(f"💰 Processing bounty: {bounty_amount:,} ISK from {source_file}")
+                    self.add_bounty_entry(timestamp, bounty_amount, source_file)
+                    
+                    # Also track in CRAB if session is active
+                    if self.crab_session_active:
+                        # Display updated once per refresh, not once per bounty
+                        self.add_crab_bounty_entry(timestamp, bounty_amount, source_file, update_display=False)
+                else:
+                    print(f"🔄 Skipping duplicate bounty: {bounty_amount:,} ISK from {source_file}")
+            
+            # Check for CONCORD link messages
+            concord_message_type = self.detect_concord_message(line, lowered)
+            if concord_message_type in ["link_start", "link_complete"]:
+                # Use the actual timestamp from the log line, not current time
+                beacon_timestamp = timestamp if timestamp else self.get_utc_now()
+                
+                # Use the helper method to update beacon session only if newer
+                self.update_beacon_session_if_newer(beacon_timestamp, source_file, concord_message_type)
+                
+                # Debug logging for beacon messages
+                # Checked once so the messages aren't built when INFO is filtered out
+                if self.logger and self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("CONCORD beacon %s detected", concord_message_type)
+                    self.logger.info("Log line timestamp: %s", timestamp)
+                    self.logger.info("Beacon timestamp: %s", beacon_timestamp)
+                    self.logger.info("Current time: %s", self.get_utc_now())
+                
+                if concord_message_type == "link_start":
+                    print(f"🔗 CONCORD Beacon start detected - timestamp: {beacon_timestamp}")
+                else:  # link_complete
+                    print(f"✅ CONCORD Beacon completion detected - timestamp: {beacon_timestamp}")
+                    
+                    # Update the link time display for completed beacons
+                    if self.concord_link_start:
+                        self.concord_time_var.set(f"Link Time: {self.concord_link_start.strftime('%H:%M:%S')} - {beacon_timestamp.strftime('%H:%M:%S')}")
+                        self.update_concord_display()
+            
+            entries.append((timestamp, line, source_file))
+        return entries
+    
     def refresh_recent_logs(self):
         """Refresh and combine recent log files - OPTION 1: No restrictive filtering, includes ALL recent logs"""
         try:
@@ -1342,14 +1502,13 @@ class EVELogReader:
             self.root.update()
             
             # Get all log files
-            all_log_files = []
-            for pattern in self.log_patterns:
-                all_log_files.extend(Path(self.eve_log_dir).glob(pattern))
+            all_log_files = [Path(entry.path) for entry in self.scan_log_directory()]
             
             if not all_log_files:
                 self.status_var.set("No log files found")
                 self.text_widget.delete(1.0, tk.END)
                 self.text_widget.insert(tk.END, "No log files found in the selected directory.")
+                self._displayed_log_entries = []
                 return
             
             # OPTION 1 IMPLEMENTATION: Multi-Account Bounty Tracking Fix
@@ -1361,8 +1520,9 @@ class EVELogReader:
             # - No more log files being excluded due to overly restrictive "active client" detection
             # - All bounty data is processed regardless of which EVE process it appears to belong to
             recent_files = []
+            current_time = self.get_utc_now()
             for log_file in all_log_files:
-                if self.is_recent_file(log_file):
+                if self.is_recent_file(log_file, current_time):
                     # OPTION 1: Include ALL recent log files regardless of "active client" status
                     # This ensures bounties from ALL EVE accounts are tracked
                     recent_files.append(log_file)
@@ -1372,97 +1532,93 @@ class EVELogReader:
                 self.status_var.set("No recent log files found")
                 self.text_widget.delete(1.0, tk.END)
                 self.text_widget.insert(tk.END, f"No log files found from the last {self.max_days_old} day(s).")
+                self._displayed_log_entries = []
                 return
             
-            # Sort files by timestamp (newest first)
+            # Keep the newest files by filename timestamp (newest first), limited to max files to show
+            # nlargest avoids sorting every recent file when only the top few are kept
             # Use timezone-aware min datetime to match our UTC timestamps
             utc_min = datetime.min.replace(tzinfo=timezone.utc)
-            recent_files.sort(key=lambda x: self.parse_filename_timestamp(x.name)[0] or utc_min, reverse=True)
-            
-            # Limit to max files to show
-            if len(recent_files) > self.max_files_to_show:
-                recent_files = recent_files[:self.max_files_to_show]
+            recent_files = heapq.nlargest(self.max_files_to_show, recent_files,
+                                          key=lambda x: self.parse_filename_timestamp(x.name)[0] or utc_min)
             
             # Process recent files and combine entries
             self.all_log_entries = []
             total_lines = 0
             
+            log_file_cache = {}
+            crab_bounties_before = len(self.crab_bounty_entries)
             for log_file in recent_files:
                 try:
-                    if os.path.exists(log_file):
-                        # Read the file
-                        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = f.readlines()
-                        
-                        # Process lines and add file source info
-                        for line in lines:
-                            timestamp = self.extract_timestamp(line)
-                            source_file = log_file.name
-                            
-                            # Check for bounty entries
-                            bounty_amount = self.extract_bounty(line)
-                            if bounty_amount and timestamp:
-                                # Check if this bounty is already tracked to avoid duplicates
-                                bounty_exists = any(
-                                    entry['timestamp'] == timestamp and 
-                                    entry['isk_amount'] == bounty_amount and 
-                                    entry['source_file'] == source_file
-                                    for entry in self.bounty_entries
-                                )
-                                
-                                if not bounty_exists:
-                                    print(f"💰 Processing bounty: {bounty_amount:,} ISK from {source_file}")
-                                    self.add_bounty_entry(timestamp, bounty_amount, source_file)
-                                    
-                                    # Also track in CRAB if session is active
-                                    if self.crab_session_active:
-                                        self.add_crab_bounty_entry(timestamp, bounty_amount, source_file)
-                                else:
-                                    print(f"🔄 Skipping duplicate bounty: {bounty_amount:,} ISK from {source_file}")
-                            
-                            # Check for CONCORD link messages
-                            concord_message_type = self.detect_concord_message(line)
-                            if concord_message_type in ["link_start", "link_complete"]:
-                                # Use the actual timestamp from the log line, not current time
-                                beacon_timestamp = timestamp if timestamp else self.get_utc_now()
-                                
-                                # Use the helper method to update beacon session only if newer
-                                self.update_beacon_session_if_newer(beacon_timestamp, source_file, concord_message_type)
-                                
-                                # Debug logging for beacon messages
-                                if self.logger:
-                                    self.logger.info(f"CONCORD beacon {concord_message_type} detected")
-                                    self.logger.info(f"Log line timestamp: {timestamp}")
-                                    self.logger.info(f"Beacon timestamp: {beacon_timestamp}")
-                                    self.logger.info(f"Current time: {self.get_utc_now()}")
-                                
-                                if concord_message_type == "link_start":
-                                    print(f"🔗 CONCORD Beacon start detected - timestamp: {beacon_timestamp}")
-                                else:  # link_complete
-                                    print(f"✅ CONCORD Beacon completion detected - timestamp: {beacon_timestamp}")
-                                    
-                                    # Update the link time display for completed beacons
-                                    if self.concord_link_start:
-                                        self.concord_time_var.set(f"Link Time: {self.concord_link_start.strftime('%H:%M:%S')} - {beacon_timestamp.strftime('%H:%M:%S')}")
-                                        self.update_concord_display()
-                            
-                            self.all_log_entries.append((timestamp, line, source_file))
+                    file_key = str(log_file)
+                    # A file deleted since the directory scan just drops out - the stat that's
+                    # needed anyway doubles as the existence check
+                    try:
+                        file_stat = os.stat(log_file)
+                    except FileNotFoundError:
+                        continue
+                    cached = self._log_file_cache.get(file_key)
+                    
+                    if cached is None or file_stat.st_size != cached['size'] or file_stat.st_mtime != cached['mtime']:
+                        # Logs are only appended to, so a file that grew only needs the bytes past
+                        # the last complete line. A new or shrunk file is read from the start
+                        full_read = cached is None or file_stat.st_size < cached['offset']
+                        if full_read:
+                            # Path.name builds a new string per call - take it once so every
+                            # entry from this file shares the same source_file object. Interned so
+                            # later refreshes reuse it too, and the source-file comparisons in the
+                            # bounty keys and beacon lookups hit the identity fast path
+                            cached = {'offset': 0, 'entries': [], 'partial': [],
+                                      'source_file': sys.intern(log_file.name),
+                                      'hasher': self.new_content_hasher()}
                         
-                        total_lines += len(lines)
+                        with open(log_file, 'rb') as f:
+                            f.seek(cached['offset'])
+                            data = f.read()
                         
-                        # Store file size and modification time for change detection
-                        self.last_file_sizes[str(log_file)] = os.path.getsize(log_file)
-                        self.last_file_sizes[f"{str(log_file)}_mtime"] = os.path.getmtime(log_file)
+                        # Only complete lines are kept for good - a line still being written is
+                        # parsed for display but read again once its newline arrives
+                        complete_end = data.rfind(b'\n') + 1
+                        new_lines = io.StringIO(data[:complete_end].decode('utf-8', errors='ignore'), newline=None)
+                        cached['entries'].extend(self._process_log_lines(new_lines, cached['source_file']))
+                        partial_lines = io.StringIO(data[complete_end:].decode('utf-8', errors='ignore'), newline=None)
+                        cached['partial'] = self._process_log_lines(partial_lines, cached['source_file'])
                         
-                        # Store content hash for change detection
-                        content_hash = self.calculate_file_hash(log_file)
-                        if content_hash:
-                            self.last_file_hashes[str(log_file)] = content_hash
+                        cached['offset'] += complete_end
+                        # Size of what was actually read, so a write racing this refresh still
+                        # counts as a change next time
+                        cached['size'] = cached['offset'] + len(data) - complete_end
+                        cached['mtime'] = file_stat.st_mtime
                         
+                        # Content hash kept up to date from the bytes just read rather than by
+                        # re-reading the whole file - the hasher holds the complete lines, and a
+                        # copy of it takes the partial tail for the current digest
+                        data_view = memoryview(data)
+                        cached['hasher'].update(data_view[:complete_end])
+                        content_hash = cached['hasher'].copy()
+                        content_hash.update(data_view[complete_end:])
+                        self.last_file_hashes[file_key] = content_hash.hexdigest()
+                    
+                    # Unchanged files reuse their parsed entries without reading them again
+                    log_file_cache[file_key] = cached
+                    self.all_log_entries.extend(cached['entries'])
+                    self.all_log_entries.extend(cached['partial'])
+                    total_lines += len(cached['entries']) + len(cached['partial'])
+                    
+                    # Store file size and modification time for change detection
+                    self.last_file_stats[file_key] = (file_stat.st_size, file_stat.st_mtime)
+                
                 except Exception as e:
                     print(f"Error reading {log_file}: {e}")
                     continue
             
+            # Files that dropped out of the recent set are forgotten
+            self._log_file_cache = log_file_cache
+            
+            # One CRAB label update for all the bounties this refresh added
+            if len(self.crab_bounty_entries) != crab_bounties_before:
+                self.update_crab_bounty_display()
+            
             # Sort all entries by timestamp (newest first)
             # Use timezone-aware min datetime to match our UTC timestamps
             utc_min = datetime.min.replace(tzinfo=timezone.utc)
@@ -1517,9 +1673,6 @@ class EVELogReader:
             # Update CONCORD display
             self.update_concord_display()
             
-            # Scan for any bounties that might have been missed
-            self.scan_existing_bounties()
-            
             # Scan for active CRAB beacons in existing logs
             self.scan_for_active_crab_beacons()
             
@@ -1527,31 +1680,90 @@ class EVELogReader:
             self.status_var.set(f"Error refreshing logs: {str(e)}")
             self.text_widget.delete(1.0, tk.END)
             self.text_widget.insert(tk.END, f"Error refreshing logs: {str(e)}")
+            self._displayed_log_entries = []
     
     def display_combined_logs(self):
         """Display all combined log entries"""
+        entries = self.all_log_entries
+        displayed = self._displayed_log_entries
+        # A copy - all_log_entries can be appended to in place (e.g. by end_crab_submit), which
+        # would otherwise change what's recorded as on screen
+        self._displayed_log_entries = list(entries)
+        
+        # Entries are newest first, so when a refresh only picked up new lines the entries
+        # already on screen are an unchanged tail - insert just the new ones at the top
+        # instead of rebuilding the whole widget
+        new_count = len(entries) - len(displayed)
+        if displayed and new_count >= 0 and entries[new_count:] == displayed:
+            if new_count:
+                self.text_widget.insert("1.0", "".join(self.iter_log_display_lines(entries[:new_count])))
+            self.text_widget.see("1.0")
+            return
+        
         self.text_widget.delete(1.0, tk.END)
         
-        if not self.all_log_entries:
+        if not entries:
             self.text_widget.insert(tk.END, "No log entries found.")
             return
         
-        # Display entries with file source information
-        for timestamp, line, source_file in self.all_log_entries:
-            # Format the display line
-            if timestamp:
-                time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                display_line = f"[{time_str}] [{source_file}] {line}"
-            else:
-                display_line = f"[NO-TIME] [{source_file}] {line}"
-            
-            self.text_widget.insert(tk.END, display_line)
+        # Display entries with file source information - one insert for the whole view
+        # instead of a Tcl round-trip per entry
+        self.text_widget.insert(tk.END, "".join(self.iter_log_display_lines(entries)))
         
         # Scroll to top to show newest entries
         self.text_widget.see("1.0")
     
+    def iter_log_display_lines(self, entries):
+        """Yield "[timestamp] [source file] line" for each log entry"""
+        # Many lines share a second (and the same datetime object), so format each stamp once
+        time_strs = {}
+        for timestamp, line, source_file in entries:
+            if timestamp:
+                time_str = time_strs.get(timestamp)
+                if time_str is None:
+                    time_str = time_strs[timestamp] = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+                yield f"[{time_str}] [{source_file}] {line}"
+            else:
+                yield f"[NO-TIME] [{source_file}] {line}"
+    
+    def scan_log_directory(self):
+        """List log files in the EVE log directory in a single os.scandir pass
+        
+        Returned DirEntry objects carry the file info from the directory listing, so
+        entry.stat() needs at most one syscall per file (none on Windows).
+        """
+        # A missing directory just has no logs (as Path.glob would report)
+        if not self.eve_log_dir or not os.path.isdir(self.eve_log_dir):
+            return []
+        
+        entries = []
+        # Scan the Path so entry.path is spelled the same way everywhere it's used as a
+        # last_file_stats/last_file_hashes key
+        with os.scandir(Path(self.eve_log_dir)) as it:
+            for entry in it:
+                if entry.name.endswith(self.log_extensions) and entry.is_file():
+                    entries.append(entry)
+        return entries
+    
+    def get_recent_log_paths(self, current_time=None):
+        """Paths of the recent log files, listing the directory again only when the last list may be out of date"""
+        # Log directories collect thousands of old files, so listing and filtering them every poll
+        # is most of a change check. The list is reused until it's RECENT_FILES_RESCAN_INTERVAL old,
+        # the directory is switched, or the directory watch saw a log file come or go
+        scanned = self._recent_log_paths
+        now = time.monotonic()
+        if (scanned is None or scanned[0] != self.eve_log_dir
+                or now - scanned[1] >= RECENT_FILES_RESCAN_INTERVAL
+                or self._log_files_changed_event.is_set()):
+            # Cleared before listing so a file created mid-scan triggers another one
+            self._log_files_changed_event.clear()
+            paths = [entry.path for entry in self.scan_log_directory()
+                     if self.is_recent_file(entry.path, current_time)]
+            scanned = self._recent_log_paths = (self.eve_log_dir, now, paths)
+        return scanned[2]
+    
     def check_for_changes(self):
-        """Check if any recent log files have changed using content hashing
+        """Check if any recent log files have changed by size and modification time
         
         OPTION 1 IMPLEMENTATION: This method now monitors ALL recent log files without
         restrictive filtering based on "active client" status. This ensures bounties
@@ -1560,76 +1772,70 @@ class EVELogReader:
         try:
             changed_files = []
             current_time = self.get_utc_now()
-            
-            print(f"\n--- Checking for file changes at {current_time.strftime('%H:%M:%S')} ---")
-            
-            for pattern in self.log_patterns:
-                for log_file in Path(self.eve_log_dir).glob(pattern):
-                    file_path = str(log_file)
-                    if os.path.exists(file_path) and self.is_recent_file(file_path):
-                        # OPTION 1 IMPLEMENTATION: Monitor ALL recent log files (no restrictive filtering)
-                        # Previously, this would skip logs from "inactive" clients, causing bounties to be missed
-                        # Now we monitor ALL recent log files to ensure bounties from all EVE accounts are tracked
-                        
-                        # Get current file stats
-                        current_size = os.path.getsize(file_path)
-                        current_mtime = os.path.getmtime(file_path)
-                        current_mtime_dt = datetime.fromtimestamp(current_mtime, tz=timezone.utc)
-                        
-                        # Calculate current content hash
-                        current_hash = self.calculate_file_hash(file_path)
-                        
-                        # Get last known stats
-                        last_size = self.last_file_sizes.get(file_path, 0)
-                        last_mtime = self.last_file_sizes.get(f"{file_path}_mtime", 0)
-                        last_hash = self.last_file_hashes.get(file_path, None)
-                        last_mtime_dt = datetime.fromtimestamp(last_mtime, tz=timezone.utc) if last_mtime > 0 else None
-                        
-                        # Calculate time differences
-                        time_since_last_check = (current_time - current_mtime_dt).total_seconds()
-                        
-                        # PRIMARY: Check if content hash changed (most reliable)
-                        # SECONDARY: Check if modification time changed
-                        # TERTIARY: Check if size changed
-                        hash_changed = current_hash and last_hash and current_hash != last_hash
-                        mtime_changed = current_mtime != last_mtime
-                        size_changed = current_size != last_size
-                        
-                        if hash_changed or mtime_changed or size_changed:
-                            changed_files.append(log_file)
-                            
-                            # Update stored values
-                            self.last_file_sizes[file_path] = current_size
-                            self.last_file_sizes[f"{file_path}_mtime"] = current_mtime
-                            if current_hash:
-                                self.last_file_hashes[file_path] = current_hash
-                            
-                            # Detailed debug info
-                            print(f"✓ File changed: {os.path.basename(file_path)}")
-                            if hash_changed:
-                                print(f"  Content: HASH CHANGED (most reliable indicator)")
-                                print(f"  Old hash: {last_hash[:8]}...")
-                                print(f"  New hash: {current_hash[:8]}...")
-                            if mtime_changed:
-                                last_mtime_str = last_mtime_dt.strftime('%H:%M:%S') if last_mtime_dt else 'Never'
-                                print(f"  MTime: {last_mtime_str} -> {current_mtime_dt.strftime('%H:%M:%S')}")
-                                print(f"  Time since last check: {time_since_last_check:.1f} seconds")
-                            if size_changed:
-                                print(f"  Size: {last_size} -> {current_size} bytes")
-                        else:
-                            # Show files that haven't changed for debugging
-                            if last_hash and last_mtime_dt:
-                                time_since_last_change = (current_time - last_mtime_dt).total_seconds()
-                                print(f"  No change: {os.path.basename(file_path)} (last modified: {time_since_last_change:.1f}s ago, hash: {last_hash[:8]}...)")
-                            else:
-                                print(f"  New file: {os.path.basename(file_path)} (first time seen)")
+            now_epoch = current_time.timestamp()  # compared with st_mtime directly - no per-file datetimes
+            
+            # Only changes are printed - this runs every poll, and a line per unchanged file
+            # every second buried the useful output (and cost a console write each on Windows)
+            tracked_paths = set()  # last_file_stats/last_file_hashes keys for files still being monitored
+            newest_log_file = None
+            for file_path in self.get_recent_log_paths(current_time):
+                # OPTION 1 IMPLEMENTATION: Monitor ALL recent log files (no restrictive filtering)
+                # Previously, this would skip logs from "inactive" clients, causing bounties to be missed
+                # Now we monitor ALL recent log files to ensure bounties from all EVE accounts are tracked
+                
+                # Get current file stats - a file deleted since the last directory scan just drops out
+                try:
+                    file_stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                tracked_paths.add(file_path)
+                log_file = Path(file_path)
+                
+                current_size = file_stat.st_size
+                current_mtime = file_stat.st_mtime
+                if newest_log_file is None or current_mtime > newest_log_file[0]:
+                    newest_log_file = (current_mtime, log_file.name)
+                
+                # Get last known stats
+                last_size, last_mtime = self.last_file_stats.get(file_path, (0, 0))
+                
+                # Size and mtime decide on their own - EVE only appends to logs, and any rewrite
+                # that shrinks the file or touches it changes one of them. Hashing the whole file
+                # here could only ever confirm a change already seen, so no file is read at all
+                time_since_last_check = now_epoch - current_mtime
+                mtime_changed = current_mtime != last_mtime
+                size_changed = current_size != last_size
+                
+                if mtime_changed or size_changed:
+                    changed_files.append(log_file)
+                    
+                    # Update stored values
+                    self.last_file_stats[file_path] = (current_size, current_mtime)
+                    
+                    # Detailed debug info
+                    print(f"✓ File changed: {os.path.basename(file_path)}")
+                    if mtime_changed:
+                        last_mtime_str = datetime.fromtimestamp(last_mtime, tz=timezone.utc).strftime('%H:%M:%S') if last_mtime > 0 else 'Never'
+                        current_mtime_str = datetime.fromtimestamp(current_mtime, tz=timezone.utc).strftime('%H:%M:%S')
+                        print(f"  MTime: {last_mtime_str} -> {current_mtime_str}")
+                        print(f"  Time since last check: {time_since_last_check:.1f} seconds")
+                    if size_changed:
+                        print(f"  Size: {last_size} -> {current_size} bytes")
+            
+            # Kept for the status bar, so each check doesn't scan the directory again on the UI thread
+            self._newest_log_file = newest_log_file
+            
+            # Forget files that were deleted or aged out of the recent window, so the
+            # bookkeeping doesn't grow forever - one set difference instead of a scan per key
+            stale_paths = (self.last_file_stats.keys() | self.last_file_hashes.keys()) - tracked_paths
+            for path in stale_paths:
+                self.last_file_stats.pop(path, None)
+                self.last_file_hashes.pop(path, None)
+            if stale_paths:
+                print(f"  Stopped tracking {len(stale_paths)} deleted or old files")
             
             if changed_files:
-                print(f"✓ Found {len(changed_files)} changed files")
-            else:
-                print("  No files changed")
-            
-            print("--- End change check ---\n")
+                print(f"✓ Found {len(changed_files)} changed files at {current_time.strftime('%H:%M:%S')}")
             return changed_files
             
         except Exception as e:
@@ -1638,33 +1844,40 @@ class EVELogReader:
     
     def extract_timestamp(self, line):
         """Extract timestamp from log line"""
-        # Common EVE log timestamp patterns
-        patterns = [
-            r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]',  # [YYYY-MM-DD HH:MM:SS] (exported format)
-            r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})',  # YYYY-MM-DD HH:MM:SS
-            r'(\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2})',  # M/D/YYYY H:MM:SS (handles single digits)
-            r'(\d{2}:\d{2}:\d{2})',  # HH:MM:SS
-        ]
+        # Every timestamp pattern contains ':', so lines without one (blank lines, most
+        # header and chat continuation lines) are rejected without touching a regex
+        if ':' not in line:
+            return None
+        
+        # One search decides whether any dated pattern can match; if not, skip straight
+        # to HH:MM:SS instead of running three searches that are bound to fail. Dated stamps
+        # need a '-' or '/', so lines with neither don't run even that search
+        if ('-' in line or '/' in line) and DATED_TIMESTAMP_RE.search(line):
+            patterns = TIMESTAMP_PATTERNS
+        else:
+            # EVE game log lines start "[ YYYY.MM.DD HH:MM:SS ]". When HH:MM:SS sits at that fixed
+            # offset with no ':' before it (so the regex couldn't match any earlier), slice it out
+            # (length checked first: a line cut off after "HH:MM:S" would pass a 1-character slice)
+            if (len(line) >= 21 and line[15:16] == ':' and line[18:19] == ':' and ':' not in line[:13]
+                    and line[13:15].isdecimal() and line[16:18].isdecimal() and line[19:21].isdecimal()):
+                try:
+                    return self._time_of_day_timestamp(line[13:21])
+                except ValueError:
+                    return None
+            patterns = TIMESTAMP_PATTERNS[-1:]
         
         for pattern in patterns:
-            match = re.search(pattern, line)
+            match = pattern.search(line)
             if match:
                 timestamp_str = match.group(1)
                 try:
                     # Try to parse the timestamp
                     if len(timestamp_str) == 8:  # HH:MM:SS
-                        # Add today's date and treat as UTC time (EVE logs are UTC)
-                        today = self.get_utc_now().strftime("%Y-%m-%d")
-                        timestamp_str = f"{today} {timestamp_str}"
-                        # Parse as UTC timestamp
-                        utc_timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                        # Make it timezone-aware UTC
-                        return utc_timestamp.replace(tzinfo=timezone.utc)
+                        return self._time_of_day_timestamp(timestamp_str)
                     
                     if len(timestamp_str) == 19:  # YYYY-MM-DD HH:MM:SS
                         # Parse as UTC timestamp (EVE Online standard)
-                        utc_timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                        return utc_timestamp.replace(tzinfo=timezone.utc)
+                        return self._parse_utc_timestamp(timestamp_str)
                     elif len(timestamp_str) == 19:  # MM/DD/YYYY HH:MM:SS
                         # Parse as UTC timestamp (EVE Online standard)
                         utc_timestamp = datetime.strptime(timestamp_str, "%m/%d/%Y %H:%M:%S")
@@ -1674,18 +1887,49 @@ class EVELogReader:
         
         return None
     
-    def extract_bounty(self, line):
+    def _time_of_day_timestamp(self, time_str):
+        """Complete an HH:MM:SS time with today's UTC date and parse it"""
+        # Add today's date and treat as UTC time (EVE logs are UTC)
+        # Only reformat the date string when the UTC day rolls over
+        today = self.get_utc_now().date()
+        if today != self._timestamp_date:
+            self._timestamp_date = today
+            self._timestamp_date_str = today.strftime("%Y-%m-%d")
+        # Parse as timezone-aware UTC timestamp
+        return self._parse_utc_timestamp(f"{self._timestamp_date_str} {time_str}")
+    
+    def _parse_utc_timestamp(self, timestamp_str):
+        """Parse a "YYYY-MM-DD HH:MM:SS" string as a UTC datetime, memoized"""
+        # Log lines arrive many to a second, so the same string comes up again and again -
+        # a dict lookup is far cheaper than strptime
+        utc_timestamp = self._timestamp_cache.get(timestamp_str)
+        if utc_timestamp is None:
+            utc_timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+            if len(self._timestamp_cache) >= TIMESTAMP_CACHE_SIZE:
+                self._timestamp_cache.clear()
+            self._timestamp_cache[timestamp_str] = utc_timestamp
+        return utc_timestamp
+    
+    def extract_bounty(self, line, lowered=None):
         """Extract bounty information from log line"""
-        # Pattern for bounty entries: (bounty) <font size=12><b><color=0xff00aa00>AMOUNT ISK</color> added to next bounty payout
-        # Simplified pattern to catch more variations
-        bounty_patterns = [
-            r'\(bounty\)\s*.*?<color[^>]*>([\d,]+)\s+ISK</color>.*?added to next bounty payout',
-            r'\(bounty\)\s*.*?([\d,]+)\s+ISK.*?added to next bounty payout',
-            r'\(bounty\)\s*.*?([\d,]+)\s+ISK',
-        ]
+        # Every pattern needs "(bounty)", which most lines don't have - skip the regexes for those
+        # (callers that already lowercased the line pass it in rather than paying for it twice)
+        if lowered is None:
+            lowered = line.lower()
+        bounty_pos = lowered.find('(bounty)')
+        if bounty_pos < 0:
+            return None
         
-        for pattern in bounty_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        # A match from a later "(bounty)" would also match from the first one, so match there
+        # only rather than letting search() retry the lazy gap from every occurrence
+        payout_pos = lowered.rfind(BOUNTY_PAYOUT_TEXT)
+        for pattern, needs_payout in BOUNTY_PATTERNS:
+            if needs_payout:
+                if payout_pos < bounty_pos:
+                    continue
+                match = pattern.match(lowered, bounty_pos, payout_pos)
+            else:
+                match = pattern.match(lowered, bounty_pos)
             if match:
                 try:
                     # Remove commas and convert to integer
@@ -1701,27 +1945,17 @@ class EVELogReader:
     def generate_beacon_id(self, source_file, beacon_timestamp):
         """Generate unique Beacon ID from file timestamp and beacon activation time"""
         try:
-            # Parse filename to extract timestamp and character ID
-            # Format: YYYYMMDD_HHMMSS_CharacterID.txt
-            filename = os.path.basename(source_file)
-            if not filename.endswith('.txt'):
-                return None
-            
-            # Extract parts from filename
-            parts = filename.replace('.txt', '').split('_')
-            if len(parts) != 3:
+            # The filename part never changes for a given log, so parse it once per file
+            if source_file in self._beacon_id_prefixes:
+                file_prefix = self._beacon_id_prefixes[source_file]
+            else:
+                file_prefix = self._parse_beacon_id_prefix(source_file)
+                self._beacon_id_prefixes[source_file] = file_prefix
+            if file_prefix is None:
                 return None
             
-            file_date = parts[0]  # YYYYMMDD
-            file_time = parts[1]  # HHMMSS
-            character_id = parts[2]  # Character ID
-            
-            # Format beacon timestamp
-            beacon_date = beacon_timestamp.strftime('%Y%m%d')
-            beacon_time = beacon_timestamp.strftime('%H%M%S')
-            
             # Combine: FileTimestamp + CharacterID + BeaconTimestamp
-            beacon_id = f"{file_date}{file_time}{character_id}{beacon_date}{beacon_time}"
+            beacon_id = f"{file_prefix}{beacon_timestamp:%Y%m%d%H%M%S}"
             
             print(f"🔗 Generated Beacon ID: {beacon_id}")
             return beacon_id
@@ -1730,23 +1964,40 @@ class EVELogReader:
             print(f"Error generating Beacon ID: {e}")
             return None
     
-    def detect_concord_message(self, line):
-        """Detect CONCORD Rogue Analysis Beacon messages"""
-        # Updated patterns based on actual EVE Online log messages
-        # Pattern for link start message - more flexible matching
-        link_start_pattern = r'\[CONCORD\].*Rogue Analysis Beacon.*link.*established'
+    def _parse_beacon_id_prefix(self, source_file):
+        """Return the FileTimestamp + CharacterID part of a Beacon ID, or None"""
+        # Format: YYYYMMDD_HHMMSS_CharacterID.txt
+        filename = os.path.basename(source_file)
+        if not filename.endswith('.txt'):
+            return None
         
-        # Pattern for link completion message - more flexible matching
-        link_complete_pattern = r'\[CONCORD\].*Rogue Analysis Beacon.*link.*completed'
+        # Extract parts from filename
+        parts = filename.replace('.txt', '').split('_')
+        if len(parts) != 3:
+            return None
         
-        # Also check for alternative patterns that might exist
-        alt_link_start_pattern = r'Your ship has started the link process with CONCORD Rogue Analysis Beacon'
-        alt_link_complete_pattern = r'Your ship successfully completed the link process with CONCORD Rogue Analysis Beacon'
+        file_date = parts[0]  # YYYYMMDD
+        file_time = parts[1]  # HHMMSS
+        character_id = parts[2]  # Character ID
+        return f"{file_date}{file_time}{character_id}"
+    
+    def detect_concord_message(self, line, lowered=None):
+        """Detect CONCORD Rogue Analysis Beacon messages"""
+        # Almost every log line is unrelated - reject those before running any regex.
+        # The shortest possible match is "[CONCORD]Rogue Analysis Beaconlinkcompleted" (43 chars)
+        # and every CONCORD_*_RE pattern contains both "CONCORD" and "Rogue Analysis Beacon"
+        if len(line) < 43:
+            return None
+        # Callers that already lowercased the line pass it in rather than paying for it twice
+        if lowered is None:
+            lowered = line.lower()
+        if 'concord' not in lowered or 'rogue analysis beacon' not in lowered:
+            return None
         
-        if re.search(link_start_pattern, line, re.IGNORECASE) or re.search(alt_link_start_pattern, line, re.IGNORECASE):
+        if CONCORD_LINK_START_RE.search(lowered) or CONCORD_ALT_LINK_START_RE.search(lowered):
             print("🔗 CONCORD link process started detected")
             return "link_start"
-        elif re.search(link_complete_pattern, line, re.IGNORECASE) or re.search(alt_link_complete_pattern, line, re.IGNORECASE):
+        elif CONCORD_LINK_COMPLETE_RE.search(lowered) or CONCORD_ALT_LINK_COMPLETE_RE.search(lowered):
             print("✅ CONCORD link process completed detected")
             return "link_complete"
         
@@ -1754,62 +2005,85 @@ class EVELogReader:
     
     def start_concord_countdown(self):
         """Start the 60-minute countdown timer for CONCORD link"""
-        if self.concord_countdown_thread and self.concord_countdown_thread.is_alive():
+        if (self.concord_countdown_thread and self.concord_countdown_thread.is_alive()
+                and not self._concord_countdown_stop.is_set()):
             return  # Already running
         
-        self.stop_concord_countdown = False
-        self.concord_countdown_thread = threading.Thread(target=self.concord_countdown_loop, daemon=True)
+        # A fresh stop event per thread: an old thread that was asked to stop but hasn't exited yet
+        # keeps its own (set) event, so starting a new countdown can never un-stop it, and there's
+        # no need to block the UI thread waiting for it
+        self._concord_countdown_stop = threading.Event()
+        self.concord_countdown_thread = threading.Thread(target=self.concord_countdown_loop,
+                                                         args=(self._concord_countdown_stop,), daemon=True)
         self.concord_countdown_thread.start()
         print("🔗 CONCORD countdown timer started")
     
-    def concord_countdown_loop(self):
-        """Countdown loop for CONCORD link process"""
-        start_time = self.get_utc_now()
-        target_time = start_time + timedelta(minutes=60)
+    def _request_concord_countdown_stop(self):
+        """Ask the countdown thread to exit and wake it so it doesn't finish its sleep"""
+        if self._concord_countdown_stop:
+            self._concord_countdown_stop.set()
+    
+    def concord_countdown_loop(self, stop_event):
+        """Countdown loop for CONCORD link process, running until stop_event is set"""
+        # Monotonic clock: cheaper than a tz-aware datetime.now() each tick and immune to clock changes
+        tick_start = time.monotonic()
+        target_time = tick_start + 60 * 60
+        last_display = None
         
-        while not self.stop_concord_countdown:
-            current_time = self.get_utc_now()
+        while not stop_event.is_set():
+            with self._beacon_lock:
+                link_completed = self.concord_link_completed
             
-            if self.concord_link_completed:
+            remaining = target_time - time.monotonic()
+            
+            if link_completed:
                 # Link completed - show countdown format but in green
-                remaining = target_time - current_time
-                minutes = int(remaining.total_seconds() // 60)
-                seconds = int(remaining.total_seconds() % 60)
+                minutes = int(remaining // 60)
+                seconds = int(remaining % 60)
                 countdown_text = f"Countdown: {minutes:02d}:{seconds:02d}"
                 color = "#00ff00"  # Green for completed
             else:
                 # Link still active - show countdown
-                remaining = target_time - current_time
-                
-                if remaining.total_seconds() <= 0:
+                if remaining <= 0:
                     # Time's up!
-                    self.root.after(0, self.concord_countdown_expired)
+                    self.root.after(0, self.concord_countdown_expired, stop_event)
                     break
                 
                 # Update countdown display
-                minutes = int(remaining.total_seconds() // 60)
-                seconds = int(remaining.total_seconds() % 60)
+                minutes = int(remaining // 60)
+                seconds = int(remaining % 60)
                 countdown_text = f"Countdown: {minutes:02d}:{seconds:02d}"
                 
                 # Always yellow while linking (until completion)
                 color = "#ffff00"  # Yellow while linking
             
-            self.root.after(0, lambda: self.update_concord_countdown(countdown_text, color))
+            # Only post to the Tk loop when the visible text or colour actually changed
+            if (countdown_text, color) != last_display:
+                last_display = (countdown_text, color)
+                self.root.after(0, self.update_concord_countdown, countdown_text, color, stop_event)
             
-            time.sleep(1)  # Update every second
+            # Sleep to the next whole second since start so the countdown doesn't drift under load
+            stop_event.wait(1 - ((time.monotonic() - tick_start) % 1))
     
-    def update_concord_countdown(self, text, color):
+    def update_concord_countdown(self, text, color, stop_event=None):
         """Update the countdown display with new text and color"""
+        # Posted from the countdown thread - drop updates queued before that countdown was stopped
+        if stop_event is not None and stop_event.is_set():
+            return
         self.concord_countdown_var.set(text)
         # Update the countdown label color
         self.concord_countdown_color = color
         self.concord_countdown_label.configure(foreground=color)
     
-    def concord_countdown_expired(self):
+    def concord_countdown_expired(self, stop_event=None):
         """Handle countdown expiration"""
+        # Same as update_concord_countdown - a countdown stopped meanwhile didn't expire
+        if stop_event is not None and stop_event.is_set():
+            return
         self.concord_status_var.set("Status: EXPIRED (Linking)")
         self.concord_countdown_var.set("Countdown: EXPIRED")
-        self.concord_countdown_active = False
+        with self._beacon_lock:
+            self.concord_countdown_active = False
         print("⚠️ CONCORD link countdown expired!")
     
     def update_concord_display(self):
@@ -1848,17 +2122,16 @@ class EVELogReader:
                 return
         
         # Stop countdown if running
-        self.stop_concord_countdown = True
-        if self.concord_countdown_thread and self.concord_countdown_thread.is_alive():
-            self.concord_countdown_thread.join(timeout=1)
+        self._request_concord_countdown_stop()
         
         # Reset all variables
-        self.concord_link_start = None
-        self.concord_link_completed = False
-        self.concord_countdown_active = False
-        self.stop_concord_countdown = False
-        self.current_beacon_id = None
-        self.beacon_source_file = None
+        with self._beacon_lock:
+            self.concord_link_start = None
+            self.concord_link_completed = False
+            self.concord_countdown_active = False
+            self.current_beacon_id = None
+            self.beacon_source_file = None
+            self._current_beacon_key = None
         
         # Reset popup prevention flag to allow new expired beacon detection
         self._expired_beacon_popup_shown = False
@@ -1882,13 +2155,15 @@ class EVELogReader:
             print(f"⚠️ Warning: Test beacon timestamp {beacon_timestamp} is in the future, using current time instead")
             beacon_timestamp = current_time
         
-        self.concord_link_start = beacon_timestamp
+        with self._beacon_lock:
+            self.concord_link_start = beacon_timestamp
+            self.concord_countdown_active = True
+            
+            # Generate test Beacon ID
+            self.current_beacon_id = f"TEST{beacon_timestamp.strftime('%Y%m%d%H%M%S')}"
+            self.beacon_source_file = "TEST_FILE.txt"
+            self._current_beacon_key = None
         self.concord_status_var.set("Status: Linking")
-        self.concord_countdown_active = True
-        
-        # Generate test Beacon ID
-        self.current_beacon_id = f"TEST{beacon_timestamp.strftime('%Y%m%d%H%M%S')}"
-        self.beacon_source_file = "TEST_FILE.txt"
         
         self.start_concord_countdown()
         self.concord_time_var.set(f"Link Time: Started at {self.concord_link_start.strftime('%H:%M:%S')}")
@@ -1899,11 +2174,12 @@ class EVELogReader:
         """Test function to simulate CONCORD link completion message"""
         print("🧪 Testing CONCORD link completion...")
         if self.concord_link_start:
-            self.concord_link_completed = True
+            with self._beacon_lock:
+                self.concord_link_completed = True
             self.concord_status_var.set("Status: Active")
             # Don't stop the countdown - let it continue to show elapsed time
             # self.concord_countdown_active = False
-            # self.stop_concord_countdown = True
+            # self._request_concord_countdown_stop()
             completion_time = self.get_utc_now()
             self.concord_time_var.set(f"Link Time: {self.concord_link_start.strftime('%H:%M:%S')} - {completion_time.strftime('%H:%M:%S')}")
             self.update_concord_display()
@@ -1927,12 +2203,12 @@ class EVELogReader:
         
         if result:
             # Stop the countdown
-            self.stop_concord_countdown = True
-            if self.concord_countdown_thread and self.concord_countdown_thread.is_alive():
-                self.concord_countdown_thread.join(timeout=1)
+            self._request_concord_countdown_stop()
             
-            # Mark as completed but failed
-            self.concord_link_completed = True
+            # Mark as completed but failed - under the lock, as the countdown thread may not
+            # have exited yet
+            with self._beacon_lock:
+                self.concord_link_completed = True
             self.concord_status_var.set("Status: Failed")
             self.concord_countdown_var.set("Countdown: --:--")
             completion_time = self.get_utc_now()
@@ -2048,12 +2324,11 @@ class EVELogReader:
                     print(f"🌐 Google Form submission result: {form_submitted}")
                 
                 # Stop the countdown
-                self.stop_concord_countdown = True
-                if self.concord_countdown_thread and self.concord_countdown_thread.is_alive():
-                    self.concord_countdown_thread.join(timeout=1)
+                self._request_concord_countdown_stop()
                 
                 # Mark as completed successfully
-                self.concord_link_completed = True
+                with self._beacon_lock:
+                    self.concord_link_completed = True
                 self.concord_status_var.set("Status: Completed")
                 self.concord_countdown_var.set("Countdown: --:--")
                 self.concord_time_var.set(f"Link Time: {self.concord_link_start.strftime('%H:%M:%S')} - {beacon_end_time.strftime('%H:%M:%S')}")
@@ -2140,8 +2415,8 @@ class EVELogReader:
                     # Split by multiple spaces (2 or more)
                     parts = re.split(r'\s{2,}', line)
                 
-                # Clean up parts
-                parts = [part.strip() for part in parts if part.strip()]
+                # Clean up parts - strip each once, then drop the empty ones
+                parts = [part for part in map(str.strip, parts) if part]
                 print(f"🔍 Line {i+1} parsed into {len(parts)} parts: {parts}")
                 
                 if len(parts) >= 2:
@@ -2149,7 +2424,8 @@ class EVELogReader:
                     amount_str = parts[1] if len(parts) > 1 else "1"
                     
                     # Clean item name (remove asterisks and other special characters)
-                    item_name = item_name.replace('*', '').strip()
+                    # Interned so repeated stacks of the same item share one string in all_loot
+                    item_name = sys.intern(item_name.replace('*', '').strip())
                     
                     # Parse amount - handle cases like "1 501" (space-separated numbers)
                     # Remove commas and spaces, then combine numbers
@@ -2267,6 +2543,8 @@ class EVELogReader:
         }
         
         self.bounty_entries.append(bounty_entry)
+        self.bounty_amounts.append(isk_amount)
+        self._bounty_keys.add((timestamp, isk_amount, source_file))
         self.total_bounty_isk += isk_amount
         
         print(f"💰 Bounty tracked: {isk_amount:,} ISK (Total: {self.total_bounty_isk:,} ISK)")
@@ -2287,6 +2565,8 @@ class EVELogReader:
                 return
         
         self.bounty_entries = []
+        self.bounty_amounts = array.array('q')
+        self._bounty_keys = set()
         self.total_bounty_isk = 0
         self.bounty_session_start = self.get_utc_now()
         self.update_bounty_display()
@@ -2300,6 +2580,7 @@ class EVELogReader:
         else:
             print("Stopping high-frequency monitoring...")
             self.stop_monitoring_only = True
+            self._log_change_event.set()
     
     def start_monitoring_only(self):
         """Start monitoring-only thread (without auto-refresh)"""
@@ -2311,31 +2592,105 @@ class EVELogReader:
     def monitoring_only_loop(self):
         """Monitoring-only loop - checks for changes and refreshes automatically"""
         print("Monitoring loop started")
+        watched_dir = None
+        observer = None
+        idle_checks = 0
         while not self.stop_monitoring_only:
-            time.sleep(1) # Check every 1 second for high-frequency monitoring
+            # Follow the log directory if the user browses to a different one
+            if WATCHDOG_AVAILABLE and watched_dir != self.eve_log_dir:
+                self._stop_log_directory_watch(observer)
+                watched_dir = self.eve_log_dir
+                observer = self._start_log_directory_watch(watched_dir)
+            
+            # File events wake us straight away; otherwise check every second for high-frequency
+            # monitoring, backing off while the logs are quiet (e.g. docked or logged off)
+            if observer:
+                # Events can lag for appends to open files, so the watched poll doesn't back off
+                poll_interval = MONITOR_POLL_INTERVAL
+            else:
+                backoff_steps = min(idle_checks // IDLE_CHECKS_PER_BACKOFF, 8)  # bounded so days idle stay cheap
+                poll_interval = min(MONITOR_POLL_INTERVAL * 2 ** backoff_steps, MAX_IDLE_MONITOR_POLL_INTERVAL)
+            self._log_change_event.wait(poll_interval)
+            self._log_change_event.clear()
             if not self.stop_monitoring_only:
-                print("Checking for file changes (monitoring)...")
                 changed_files = self.check_for_changes()
                 if changed_files:
-                    print(f"Changed files detected: {len(changed_files)} - refreshing automatically")
-                    self.root.after(0, self.refresh_recent_logs)
+                    idle_checks = 0
+                    # A refresh can take longer than the poll interval - fold changes into the one already queued
+                    if self._auto_refresh_pending:
+                        print(f"Changed files detected: {len(changed_files)} - refresh already queued")
+                    else:
+                        print(f"Changed files detected: {len(changed_files)} - refreshing automatically")
+                        self._auto_refresh_pending = True
+                        # A short delay so a burst of writes (combat lines arrive one at a time) lands in one refresh
+                        self.root.after(AUTO_REFRESH_DELAY_MS, self._run_auto_refresh)
                 else:
-                    print("No changes detected, continuing to monitor...")
+                    idle_checks += 1
                     # Even if no changes, update status to show we're still checking
-                    if self.last_refresh_time:
-                        self.root.after(0, self.update_status_with_check_time)
+                    # (skipped while one is still queued behind a busy UI thread, or a refresh will update it anyway)
+                    if self.last_refresh_time and not self._status_update_pending and not self._auto_refresh_pending:
+                        self._status_update_pending = True
+                        self.root.after(0, self._run_status_update)
+        
+        self._stop_log_directory_watch(observer)
+    
+    def _run_status_update(self):
+        """Run a status bar update queued by the monitoring loop"""
+        self._status_update_pending = False
+        self.update_status_with_check_time()
+    
+    def _run_auto_refresh(self):
+        """Run a refresh queued by the monitoring loop"""
+        # Cleared first so changes made while refreshing queue another pass
+        self._auto_refresh_pending = False
+        self.refresh_recent_logs()
+    
+    def _start_log_directory_watch(self, directory):
+        """Start a watchdog observer on the log directory, or return None to keep polling"""
+        if not directory or not os.path.isdir(directory):
+            return None
+        
+        try:
+            observer = Observer()
+            observer.schedule(LogDirectoryEventHandler(self._log_change_event, self.log_extensions, self._log_files_changed_event), directory, recursive=False)
+            observer.daemon = True
+            observer.start()
+            print(f"👀 Watching {directory} for log changes")
+            return observer
+        except Exception as e:
+            print(f"⚠️ Could not watch log directory, polling instead: {e}")
+            return None
+    
+    def _stop_log_directory_watch(self, observer):
+        """Stop a watchdog observer started by _start_log_directory_watch"""
+        if observer:
+            observer.stop()
+            observer.join(timeout=1)
+    
+    def new_content_hasher(self):
+        """Create the hash object used for log file content hashes"""
+        # BLAKE2b is faster than MD5 in CPython; refresh and calculate_file_hash must agree
+        return hashlib.blake2b(digest_size=16)
     
     def calculate_file_hash(self, file_path):
-        """Calculate MD5 hash of file content for change detection"""
+        """Calculate BLAKE2b hash of file content for change detection"""
         try:
-            if not os.path.exists(file_path):
-                return None
-            
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            # 1 MB reads keep the Python loop short on big logs. Read straight into one buffer
+            # (unbuffered file, no bytes object per chunk). The buffer is per call because both
+            # the UI thread and the monitoring thread hash files
+            file_hash = self.new_content_hasher()
+            buffer = bytearray(1 << 20)
+            view = memoryview(buffer)
+            with open(file_path, "rb", buffering=0) as f:
+                while True:
+                    size = f.readinto(buffer)
+                    if not size:
+                        break
+                    file_hash.update(view[:size])
+            return file_hash.hexdigest()
+        except FileNotFoundError:
+            # Opening is the existence check - a missing file just has no hash
+            return None
         except Exception as e:
             print(f"Error calculating hash for {file_path}: {e}")
             return None
@@ -2346,22 +2701,11 @@ class EVELogReader:
             file_info = []
             current_time = self.get_utc_now()
             
-            for pattern in self.log_patterns:
-                for log_file in Path(self.eve_log_dir).glob(pattern):
-                    if os.path.exists(log_file) and self.is_recent_file(log_file):
-                        file_path = str(log_file)
-                        mtime = os.path.getmtime(file_path)
-                        mtime_dt = datetime.fromtimestamp(mtime, tz=timezone.utc)
-                        time_ago = (current_time - mtime_dt).total_seconds()
-                        
-                        if time_ago < 60:
-                            time_str = f"{time_ago:.0f}s ago"
-                        elif time_ago < 3600:
-                            time_str = f"{time_ago/60:.0f}m ago"
-                        else:
-                            time_str = f"{time_ago/3600:.1f}h ago"
-                        
-                        file_info.append((log_file.name, mtime_dt, time_str))
+            for entry in self.scan_log_directory():
+                if self.is_recent_file(entry.path, current_time):
+                    mtime_dt = datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc)
+                    time_str = self.format_time_ago((current_time - mtime_dt).total_seconds())
+                    file_info.append((entry.name, mtime_dt, time_str))
             
             # Sort by modification time (newest first)
             file_info.sort(key=lambda x: x[1], reverse=True)
@@ -2371,6 +2715,15 @@ class EVELogReader:
             print(f"Error getting file modification info: {e}")
             return []
     
+    def format_time_ago(self, time_ago):
+        """Format an age in seconds as a short 's/m/h ago' string"""
+        if time_ago < 60:
+            return f"{time_ago:.0f}s ago"
+        elif time_ago < 3600:
+            return f"{time_ago/60:.0f}m ago"
+        else:
+            return f"{time_ago/3600:.1f}h ago"
+    
     def update_status_with_check_time(self):
         """Update status to show last check time and file modification info"""
         if self.last_refresh_time:
@@ -2379,14 +2732,13 @@ class EVELogReader:
             minutes = int(time_since_refresh.total_seconds() // 60)
             seconds = int(time_since_refresh.total_seconds() % 60)
             
-            # Get file modification info
-            file_info = self.get_file_modification_info()
-            if file_info:
-                newest_file = file_info[0]
-                newest_time = newest_file[1]
-                newest_ago = newest_file[2]
+            # Newest file from the change check that queued this update - no directory scan here
+            newest_log_file = self._newest_log_file
+            if newest_log_file:
+                newest_mtime, newest_name = newest_log_file
+                newest_ago = self.format_time_ago(current_time.timestamp() - newest_mtime)
                 
-                status_text = f"v{APP_VERSION} | Last refresh: {self.last_refresh_time.strftime('%H:%M:%S')} | Last check: {current_time.strftime('%H:%M:%S')} | Newest file: {newest_file[0]} ({newest_ago})"
+                status_text = f"v{APP_VERSION} | Last refresh: {self.last_refresh_time.strftime('%H:%M:%S')} | Last check: {current_time.strftime('%H:%M:%S')} | Newest file: {newest_name} ({newest_ago})"
             else:
                 status_text = f"v{APP_VERSION} | Last refresh: {self.last_refresh_time.strftime('%H:%M:%S')} | Last check: {current_time.strftime('%H:%M:%S')}"
             
@@ -2549,7 +2901,12 @@ class EVELogReader:
             # Add footer
             text_widget.insert(tk.END, f"\nChecked at: {current_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             text_widget.insert(tk.END, f"Total files: {len(file_info)}\n")
-            text_widget.insert(tk.END, f"Monitoring: {'High-frequency (1s)' if self.high_freq_var.get() else 'Normal (3s)'}\n")
+            if self.high_freq_var.get():
+                # Polling backs off while the logs are quiet, unless a directory watch is running
+                monitoring_text = f"High-frequency ({MONITOR_POLL_INTERVAL}s, up to {MAX_IDLE_MONITOR_POLL_INTERVAL}s when idle without a directory watch)"
+            else:
+                monitoring_text = "Off"
+            text_widget.insert(tk.END, f"Monitoring: {monitoring_text}\n")
             
             # Make text read-only
             text_widget.config(state=tk.DISABLED)
@@ -2595,6 +2952,7 @@ class EVELogReader:
         """Clear the display"""
         self.text_widget.delete(1.0, tk.END)
         self.text_widget.insert(tk.END, "Display cleared.")
+        self._displayed_log_entries = []
     
     def export_logs(self):
         """Export recent logs to a file"""
@@ -2607,18 +2965,13 @@ class EVELogReader:
             )
             
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
+                with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                     f.write(f"EVE Online Recent Logs - Exported on {self.get_utc_now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write(f"Filter: Last {self.max_days_old} day(s), Max {self.max_files_to_show} files\n")
                     f.write("=" * 80 + "\n\n")
                     
-                    for timestamp, line, source_file in self.all_log_entries:
-                        if timestamp:
-                            time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                            export_line = f"[{time_str}] [{source_file}] {line}"
-                        else:
-                            export_line = f"[NO-TIME] [{source_file}] {line}"
-                        f.write(export_line)
+                    # Hand the lines to the buffered writer in one call instead of one write() per line
+                    f.writelines(self.iter_log_display_lines(self.all_log_entries))
                 
                 self.status_var.set(f"Recent logs exported to {os.path.basename(file_path)}")
                 messagebox.showinfo("Export Complete", f"Recent logs exported successfully to:\n{file_path}")
@@ -2685,20 +3038,8 @@ class EVELogReader:
             text_widget.insert(tk.END, "Individual Bounty Entries (Newest First):\n")
             text_widget.insert(tk.END, "-" * 80 + "\n\n")
             
-            # Sort entries by timestamp (newest first)
-            sorted_entries = sorted(self.bounty_entries, key=lambda x: x['timestamp'], reverse=True)
-            
-            for i, entry in enumerate(sorted_entries, 1):
-                timestamp = entry['timestamp']
-                isk_amount = entry['isk_amount']
-                source_file = entry['source_file']
-                running_total = entry['running_total']
-                
-                text_widget.insert(tk.END, f"{i:2d}. {timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                text_widget.insert(tk.END, f"    Amount: {isk_amount:,} ISK\n")
-                text_widget.insert(tk.END, f"    Source: {source_file}\n")
-                text_widget.insert(tk.END, f"    Running Total: {running_total:,} ISK\n")
-                text_widget.insert(tk.END, "-" * 40 + "\n")
+            # All entries in one insert rather than five Tk calls per entry
+            text_widget.insert(tk.END, "".join(self.iter_bounty_entry_blocks(self.bounty_entries)))
             
             # Summary
             text_widget.insert(tk.END, f"\n📊 Summary:\n")
@@ -2709,11 +3050,9 @@ class EVELogReader:
                 avg_bounty = self.total_bounty_isk / len(self.bounty_entries)
                 text_widget.insert(tk.END, f"Average Bounty: {avg_bounty:,.0f} ISK\n")
                 
-                # Largest and smallest bounties
-                largest = max(self.bounty_entries, key=lambda x: x['isk_amount'])
-                smallest = min(self.bounty_entries, key=lambda x: x['isk_amount'])
-                text_widget.insert(tk.END, f"Largest Bounty: {largest['isk_amount']:,} ISK\n")
-                text_widget.insert(tk.END, f"Smallest Bounty: {smallest['isk_amount']:,} ISK\n")
+                # Largest and smallest bounties - straight off the amount column, no per-entry key lookups
+                text_widget.insert(tk.END, f"Largest Bounty: {max(self.bounty_amounts):,} ISK\n")
+                text_widget.insert(tk.END, f"Smallest Bounty: {min(self.bounty_amounts):,} ISK\n")
             
             # Make text read-only
             text_widget.config(state=tk.DISABLED)
@@ -2753,27 +3092,15 @@ class EVELogReader:
             )
             
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
+                with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                     f.write(f"EVE Online Bounty Tracking - Exported on {self.get_utc_now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write(f"Session Start: {self.bounty_session_start.strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write(f"Total Bounties: {len(self.bounty_entries)}\n")
                     f.write(f"Total ISK Earned: {self.total_bounty_isk:,} ISK\n")
                     f.write("=" * 80 + "\n\n")
                     
-                    # Sort entries by timestamp (newest first)
-                    sorted_entries = sorted(self.bounty_entries, key=lambda x: x['timestamp'], reverse=True)
-                    
-                    for i, entry in enumerate(sorted_entries, 1):
-                        timestamp = entry['timestamp']
-                        isk_amount = entry['isk_amount']
-                        source_file = entry['source_file']
-                        running_total = entry['running_total']
-                        
-                        f.write(f"{i:2d}. {timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                        f.write(f"    Amount: {isk_amount:,} ISK\n")
-                        f.write(f"    Source: {source_file}\n")
-                        f.write(f"    Running Total: {running_total:,} ISK\n")
-                        f.write("-" * 40 + "\n")
+                    # Hand the entry blocks to the buffered writer in one call
+                    f.writelines(self.iter_bounty_entry_blocks(self.bounty_entries))
                 
                 self.status_var.set(f"Bounty tracking exported to {os.path.basename(file_path)}")
                 messagebox.showinfo("Export Complete", f"Bounty tracking exported successfully to:\n{file_path}")
@@ -2782,8 +3109,22 @@ class EVELogReader:
             messagebox.showerror("Export Error", f"Error exporting bounties: {str(e)}")
             self.status_var.set(f"Export error: {str(e)}")
     
+    def iter_bounty_entry_blocks(self, entries):
+        """Yield the text block for each bounty entry, newest first"""
+        separator = "-" * 40 + "\n"
+        entry_fields = itemgetter('timestamp', 'isk_amount', 'source_file', 'running_total')
+        sorted_entries = sorted(entries, key=itemgetter('timestamp'), reverse=True)
+        for i, (timestamp, isk_amount, source_file, running_total) in enumerate(map(entry_fields, sorted_entries), 1):
+            yield (
+                f"{i:2d}. {timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"    Amount: {isk_amount:,} ISK\n"
+                f"    Source: {source_file}\n"
+                f"    Running Total: {running_total:,} ISK\n"
+                + separator
+            )
+    
     # CRAB Bounty Tracking Functions
-    def add_crab_bounty_entry(self, timestamp, isk_amount, source_file):
+    def add_crab_bounty_entry(self, timestamp, isk_amount, source_file, update_display=True):
         """Add a new bounty entry to the CRAB tracking system"""
         if not self.crab_session_active:
             print("⚠️ CRAB session not active - bounty not tracked")
@@ -2797,10 +3138,12 @@ class EVELogReader:
         }
         
         self.crab_bounty_entries.append(bounty_entry)
+        self.crab_bounty_amounts.append(isk_amount)
         self.crab_total_bounty_isk += isk_amount
         
         print(f"🦀 CRAB bounty tracked: {isk_amount:,} ISK (CRAB Total: {self.crab_total_bounty_isk:,} ISK)")
-        self.update_crab_bounty_display()
+        if update_display:
+            self.update_crab_bounty_display()
     
     def reset_crab_bounty_tracking(self):
         """Reset CRAB bounty tracking to start fresh"""
@@ -2818,6 +3161,7 @@ class EVELogReader:
                 return
         
         self.crab_bounty_entries = []
+        self.crab_bounty_amounts = array.array('q')
         self.crab_total_bounty_isk = 0
         self.update_crab_bounty_display()
         print("🔄 CRAB bounty tracking reset")
@@ -2888,20 +3232,8 @@ class EVELogReader:
             text_widget.insert(tk.END, "Individual CRAB Bounty Entries (Newest First):\n")
             text_widget.insert(tk.END, "-" * 80 + "\n\n")
             
-            # Sort entries by timestamp (newest first)
-            sorted_entries = sorted(self.crab_bounty_entries, key=lambda x: x['timestamp'], reverse=True)
-            
-            for i, entry in enumerate(sorted_entries, 1):
-                timestamp = entry['timestamp']
-                isk_amount = entry['isk_amount']
-                source_file = entry['source_file']
-                running_total = entry['running_total']
-                
-                text_widget.insert(tk.END, f"{i:2d}. {timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                text_widget.insert(tk.END, f"    Amount: {isk_amount:,} ISK\n")
-                text_widget.insert(tk.END, f"    Source: {source_file}\n")
-                text_widget.insert(tk.END, f"    Running Total: {running_total:,} ISK\n")
-                text_widget.insert(tk.END, "-" * 40 + "\n")
+            # All entries in one insert rather than five Tk calls per entry
+            text_widget.insert(tk.END, "".join(self.iter_bounty_entry_blocks(self.crab_bounty_entries)))
             
             # Summary
             text_widget.insert(tk.END, f"\n📊 CRAB Summary:\n")
@@ -2912,11 +3244,9 @@ class EVELogReader:
                 avg_bounty = self.crab_total_bounty_isk / len(self.crab_bounty_entries)
                 text_widget.insert(tk.END, f"Average CRAB Bounty: {avg_bounty:,.0f} ISK\n")
                 
-                # Largest and smallest bounties
-                largest = max(self.crab_bounty_entries, key=lambda x: x['isk_amount'])
-                smallest = min(self.crab_bounty_entries, key=lambda x: x['isk_amount'])
-                text_widget.insert(tk.END, f"Largest CRAB Bounty: {largest['isk_amount']:,} ISK\n")
-                text_widget.insert(tk.END, f"Smallest CRAB Bounty: {smallest['isk_amount']:,} ISK\n")
+                # Largest and smallest bounties - straight off the amount column, no per-entry key lookups
+                text_widget.insert(tk.END, f"Largest CRAB Bounty: {max(self.crab_bounty_amounts):,} ISK\n")
+                text_widget.insert(tk.END, f"Smallest CRAB Bounty: {min(self.crab_bounty_amounts):,} ISK\n")
             
             # Make text read-only
             text_widget.config(state=tk.DISABLED)
@@ -2961,10 +3291,8 @@ class EVELogReader:
         
         # Reset popup prevention flag when starting a new session
         # This allows expired beacon detection for future sessions
-        if hasattr(self, '_expired_beacon_popup_shown'):
-            self._expired_beacon_popup_shown = False
-        if hasattr(self, '_startup_popup_shown'):
-            self._startup_popup_shown = False
+        self._expired_beacon_popup_shown = False
+        self._startup_popup_shown = False
         
         self.update_crab_bounty_display()
         print("🦀 CRAB bounty tracking session started")
@@ -3026,11 +3354,8 @@ class EVELogReader:
                 return
             
             # Read CSV data
-            sessions = []
             with open(csv_filename, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    sessions.append(row)
+                sessions = list(csv.DictReader(csvfile))
             
             if not sessions:
                 messagebox.showinfo("No Sessions", "No beacon sessions found in the CSV file.")
@@ -3077,7 +3402,9 @@ class EVELogReader:
             text_widget.insert(tk.END, header)
             text_widget.insert(tk.END, "-" * 120 + "\n")
             
-            # Display each session
+            # Display each session - rows are collected and inserted in one call, a
+            # Text insert per row gets slow once the CSV holds many sessions
+            session_lines = []
             for i, session in enumerate(sessions, 1):
                 # Format the data for display
                 beacon_id = session.get('Beacon ID', 'UNKNOWN')
@@ -3097,7 +3424,8 @@ class EVELogReader:
                 
                 # Format the line
                 line = f"{beacon_id:<20} | {start_time:<19} | {end_time:<19} | {duration:<8} | {crab_bounty:<11} | {rogue_data:<10} | {loot_value:<10} | {source_file}\n"
-                text_widget.insert(tk.END, line)
+                session_lines.append(line)
+            text_widget.insert(tk.END, "".join(session_lines))
             
             # Add summary at the bottom
             text_widget.insert(tk.END, "\n" + "=" * 120 + "\n")
@@ -3105,9 +3433,7 @@ class EVELogReader:
             text_widget.insert(tk.END, "=" * 120 + "\n")
             
             # Calculate totals
-            total_crab_bounty = sum(float(s.get('Total CRAB Bounty (ISK)', '0').replace(',', '')) for s in sessions)
-            total_rogue_data = sum(int(s.get('Rogue Drone Data Amount', '0')) for s in sessions)
-            total_loot_value = sum(float(s.get('Total Loot Value (ISK)', '0').replace(',', '')) for s in sessions)
+            total_crab_bounty, total_rogue_data, total_loot_value = self.summarize_beacon_sessions(sessions)
             
             text_widget.insert(tk.END, f"Total Sessions: {len(sessions)}\n")
             text_widget.insert(tk.END, f"Total CRAB Bounty: {total_crab_bounty:,.0f} ISK\n")
@@ -3133,6 +3459,17 @@ class EVELogReader:
             print(f"❌ Error viewing beacon sessions: {e}")
             messagebox.showerror("Error", f"Error viewing beacon sessions:\n\n{str(e)}")
     
+    def summarize_beacon_sessions(self, sessions):
+        """Total CRAB bounty, rogue drone data and loot value over sessions in one pass"""
+        total_crab_bounty = 0.0
+        total_rogue_data = 0
+        total_loot_value = 0.0
+        for session in sessions:
+            total_crab_bounty += float(session.get('Total CRAB Bounty (ISK)', '0').replace(',', ''))
+            total_rogue_data += int(session.get('Rogue Drone Data Amount', '0'))
+            total_loot_value += float(session.get('Total Loot Value (ISK)', '0').replace(',', ''))
+        return total_crab_bounty, total_rogue_data, total_loot_value
+    
     def export_beacon_sessions_to_text(self, sessions):
         """Export beacon sessions to a text file"""
         try:
@@ -3146,7 +3483,7 @@ class EVELogReader:
             if not file_path:
                 return
             
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 f.write(f"EVE Online Beacon Sessions - Exported on {self.get_utc_now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write("=" * 80 + "\n\n")
                 
@@ -3166,9 +3503,7 @@ class EVELogReader:
                     f.write(f"Export Date: {session.get('Export Date', 'UNKNOWN')}\n\n")
                 
                 # Add summary
-                total_crab_bounty = sum(float(s.get('Total CRAB Bounty (ISK)', '0').replace(',', '')) for s in sessions)
-                total_rogue_data = sum(int(s.get('Rogue Drone Data Amount', '0')) for s in sessions)
-                total_loot_value = sum(float(s.get('Total Loot Value (ISK)', '0').replace(',', '')) for s in sessions)
+                total_crab_bounty, total_rogue_data, total_loot_value = self.summarize_beacon_sessions(sessions)
                 
                 f.write("SUMMARY\n")
                 f.write("-" * 40 + "\n")
@@ -3675,7 +4010,11 @@ For EVE Online players and ISK hunters
     def update_beacon_session_if_newer(self, new_beacon_timestamp, new_source_file, new_message_type):
         """Update beacon session only if the new one is more recent than the current one"""
         try:
-            current_time = self.get_utc_now()
+            # A trailing line without its newline yet is parsed again on every refresh until it's
+            # complete (and a file that shrank is read again from the start) - skip the beacon
+            # we are already tracking rather than restarting its session
+            if self._current_beacon_key == (new_beacon_timestamp, new_source_file):
+                return False
             
             # If we don't have a current session, always start tracking
             if not self.concord_link_start:
@@ -3710,28 +4049,33 @@ For EVE Online players and ISK hunters
         try:
             current_time = self.get_utc_now()
             
+            # Remember which log line this session came from before any clamping below
+            session_key = (beacon_timestamp, source_file)
+            
             # Validate that the beacon timestamp is not in the future
             if beacon_timestamp > current_time:
                 print(f"⚠️ Warning: Beacon timestamp {beacon_timestamp} is in the future, using current time instead")
                 beacon_timestamp = current_time
             
+            # Generate unique Beacon ID
+            beacon_id = self.generate_beacon_id(source_file, beacon_timestamp)
+            
             # Set up beacon tracking
-            self.concord_link_start = beacon_timestamp
-            self.concord_link_completed = (message_type == "link_complete")
+            with self._beacon_lock:
+                self.concord_link_start = beacon_timestamp
+                self.concord_link_completed = (message_type == "link_complete")
+                self.concord_countdown_active = True
+                self.current_beacon_id = beacon_id
+                self.beacon_source_file = source_file
+                self._current_beacon_key = session_key
             
             if message_type == "link_start":
                 self.concord_status_var.set("Status: Linking")
-                self.concord_countdown_active = True
                 print(f"🔗 Starting new CONCORD beacon session - Status: Linking")
             else:  # link_complete
                 self.concord_status_var.set("Status: Active")
-                self.concord_countdown_active = True
                 print(f"🔗 Starting new completed CONCORD beacon session - Status: Active")
             
-            # Generate unique Beacon ID
-            self.current_beacon_id = self.generate_beacon_id(source_file, beacon_timestamp)
-            self.beacon_source_file = source_file
-            
             # Start CRAB bounty tracking session
             self.start_crab_session()
             
@@ -3753,15 +4097,17 @@ For EVE Online players and ISK hunters
         """Stop the current beacon session"""
         try:
             if self.concord_countdown_active:
-                self.stop_concord_countdown = True
-                self.concord_countdown_active = False
+                self._request_concord_countdown_stop()
                 print(f"⏹️ Stopped current beacon session countdown")
             
             # Clear current session data
-            self.concord_link_start = None
-            self.concord_link_completed = False
-            self.current_beacon_id = None
-            self.beacon_source_file = None
+            with self._beacon_lock:
+                self.concord_countdown_active = False
+                self.concord_link_start = None
+                self.concord_link_completed = False
+                self.current_beacon_id = None
+                self.beacon_source_file = None
+                self._current_beacon_key = None
             
             # Stop CRAB session
             if self.crab_session_active:
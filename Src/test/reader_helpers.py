@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Shared setup for tests that run EVELogReader methods without the Tkinter UI
+"""
+
+import os
+import sys
+
+# Add the Src directory to the path so we can import eve_log_reader
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import eve_log_reader
+
+
+def make_reader(**attributes):
+    """Create an EVELogReader without running __init__ (no Tk window), with only the given attributes set"""
+    reader = eve_log_reader.EVELogReader.__new__(eve_log_reader.EVELogReader)
+    for name, value in attributes.items():
+        setattr(reader, name, value)
+    return reader
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test bounty amount extraction from log lines
+Runs extract_bounty without the Tkinter UI
+"""
+
+import time
+
+from reader_helpers import make_reader
+
+
+def test_extracts_bounty_amounts():
+    """Formatted and plain bounty lines give the ISK amount"""
+    reader = make_reader()
+    
+    assert reader.extract_bounty("[ 2025.01.15 12:00:00 ] (bounty) <font size=12><b><color=0xff00aa00>125,000 ISK</color> added to next bounty payout\n") == 125000
+    assert reader.extract_bounty("[ 2025.01.15 12:00:00 ] (bounty) 98765 ISK added to next bounty payout\n") == 98765
+    assert reader.extract_bounty("[ 2025.01.15 12:00:00 ] (BOUNTY) 5,000 isk\n") == 5000
+
+
+def test_ignores_non_bounty_lines():
+    """Lines that aren't bounty notifications give None"""
+    reader = make_reader()
+    
+    assert reader.extract_bounty("[ 2025.01.15 12:00:00 ] (combat) 500 ISK\n") is None
+    assert reader.extract_bounty("[ 2025.01.15 12:00:00 ] (bounty) nothing here\n") is None
+    assert reader.extract_bounty("") is None
+
+
+def test_near_miss_long_line_is_fast():
+    """A long bounty line with digits but no ISK is rejected without heavy backtracking"""
+    reader = make_reader()
+    
+    line = "(bounty) x" + " " * 3000 + "1" * 3000 + "\n"
+    start = time.perf_counter()
+    assert reader.extract_bounty(line) is None
+    assert time.perf_counter() - start < 0.1
+
+
+def test_near_miss_many_amounts_is_fast():
+    """A long bounty line with many ISK amounts but no payout text doesn't rescan per amount"""
+    reader = make_reader()
+    
+    line = "(bounty) " + "<color=0xff00aa00>1 ISK</color> " * 3000 + "\n"
+    start = time.perf_counter()
+    assert reader.extract_bounty(line) == 1
+    assert time.perf_counter() - start < 0.1
+    assert reader.extract_bounty("(bounty) (bounty) 5 isk added to next bounty payout\n") == 5
+
+
+if __name__ == "__main__":
+    test_extracts_bounty_amounts()
+    test_ignores_non_bounty_lines()
+    test_near_miss_long_line_is_fast()
+    test_near_miss_many_amounts_is_fast()
+    print("✅ All bounty detection tests passed!")
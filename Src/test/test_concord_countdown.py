@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test the CONCORD countdown thread start/stop lifecycle
+"""
+
+import threading
+
+from reader_helpers import make_reader
+
+
+class RecordingRoot:
+    """Stand-in for the Tk root that records after() posts instead of running them"""
+    def __init__(self):
+        self.posts = []
+    
+    def after(self, delay, callback, *args):
+        self.posts.append((callback, args))
+
+
+def make_countdown_reader():
+    return make_reader(root=RecordingRoot(), _beacon_lock=threading.Lock(), concord_link_completed=False,
+                       concord_countdown_thread=None, _concord_countdown_stop=None)
+
+
+def test_restart_gives_new_thread_its_own_stop_event():
+    """Restarting after a stop must not un-stop the old thread"""
+    reader = make_countdown_reader()
+    reader.start_concord_countdown()
+    first_thread = reader.concord_countdown_thread
+    first_stop = reader._concord_countdown_stop
+    
+    reader._request_concord_countdown_stop()
+    reader.start_concord_countdown()
+    
+    assert first_stop.is_set()
+    assert reader._concord_countdown_stop is not first_stop
+    assert not reader._concord_countdown_stop.is_set()
+    assert reader.concord_countdown_thread is not first_thread
+    
+    first_thread.join(timeout=2)
+    assert not first_thread.is_alive()
+    
+    reader._request_concord_countdown_stop()
+    reader.concord_countdown_thread.join(timeout=2)
+    assert not reader.concord_countdown_thread.is_alive()
+    print("✅ Restart gives the new countdown thread its own stop event")
+
+
+def test_start_while_running_is_a_no_op():
+    """A second start while the countdown is running keeps the same thread"""
+    reader = make_countdown_reader()
+    reader.start_concord_countdown()
+    thread = reader.concord_countdown_thread
+    
+    reader.start_concord_countdown()
+    assert reader.concord_countdown_thread is thread
+    
+    reader._request_concord_countdown_stop()
+    thread.join(timeout=2)
+    print("✅ Starting a running countdown is a no-op")
+
+
+def test_posts_from_stopped_countdown_are_dropped():
+    """Updates queued by a countdown before it was stopped don't touch the display"""
+    updates = []
+    reader = make_reader(concord_countdown_var=type("Var", (), {"set": lambda self, text: updates.append(text)})())
+    stop_event = threading.Event()
+    stop_event.set()
+    
+    reader.update_concord_countdown("Countdown: 59:59", "#ffff00", stop_event)
+    reader.concord_countdown_expired(stop_event)
+    
+    assert updates == []
+    print("✅ Posts from a stopped countdown are dropped")
+
+
+if __name__ == "__main__":
+    print("Testing CONCORD countdown lifecycle...")
+    print("=" * 50)
+    test_restart_gives_new_thread_its_own_stop_event()
+    test_start_while_running_is_a_no_op()
+    test_posts_from_stopped_countdown_are_dropped()
+    print("=" * 50)
+    print("✅ All CONCORD countdown tests passed!")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test CONCORD Rogue Analysis Beacon message detection
+Runs detect_concord_message without the Tkinter UI
+"""
+
+import time
+
+from reader_helpers import make_reader
+
+
+def test_detects_link_start_and_complete():
+    """Both message formats are classified correctly"""
+    reader = make_reader()
+    
+    start_line = "[ 2025.01.15 12:00:00 ] (notify) [CONCORD] Rogue Analysis Beacon: The link has been established.\n"
+    complete_line = "[ 2025.01.15 12:05:00 ] (notify) [CONCORD] Rogue Analysis Beacon: Data link completed.\n"
+    alt_start_line = "[ 2025.01.15 12:00:00 ] (notify) Your ship has started the link process with CONCORD Rogue Analysis Beacon.\n"
+    alt_complete_line = "[ 2025.01.15 12:05:00 ] (notify) Your ship successfully completed the link process with CONCORD Rogue Analysis Beacon.\n"
+    
+    assert reader.detect_concord_message(start_line) == "link_start"
+    assert reader.detect_concord_message(complete_line) == "link_complete"
+    assert reader.detect_concord_message(alt_start_line) == "link_start"
+    assert reader.detect_concord_message(alt_complete_line) == "link_complete"
+    assert reader.detect_concord_message(start_line.lower()) == "link_start"
+
+
+def test_ignores_unrelated_lines():
+    """Lines without the full CONCORD message are not classified"""
+    reader = make_reader()
+    
+    assert reader.detect_concord_message("[ 2025.01.15 12:00:00 ] (bounty) 125 000 ISK added to next bounty payout\n") is None
+    assert reader.detect_concord_message("[ 2025.01.15 12:00:00 ] (notify) [CONCORD] Rogue Analysis Beacon link\n") is None
+    assert reader.detect_concord_message("") is None
+
+
+def test_near_miss_long_line_is_fast():
+    """A long line that almost matches is rejected without heavy backtracking"""
+    reader = make_reader()
+    
+    line = "[CONCORD] " + "Rogue Analysis Beacon link " * 2000 + "\n"
+    start = time.perf_counter()
+    assert reader.detect_concord_message(line) is None
+    assert time.perf_counter() - start < 0.1
+
+
+if __name__ == "__main__":
+    test_detects_link_start_and_complete()
+    test_ignores_unrelated_lines()
+    test_near_miss_long_line_is_fast()
+    print("✅ All CONCORD detection tests passed!")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Test the incremental log refresh: only bytes appended since the last refresh are parsed
+Runs refresh_recent_logs against a temporary log directory without the Tkinter UI
+"""
+
+import array
+import os
+import shutil
+import tempfile
+import types
+from pathlib import Path
+
+from reader_helpers import eve_log_reader, make_reader
+
+LOG_NAME = "20250101_120000_123.txt"
+BOUNTY_1 = "[ 2025.01.01 12:00:00 ] (bounty) 1,000 ISK added to next bounty payout\n"
+BOUNTY_2 = "[ 2025.01.01 12:00:02 ] (bounty) 2,000 ISK added to next bounty payout\n"
+
+
+class StubVar:
+    """Stand-in for a Tk variable"""
+    def __init__(self, value=None):
+        self.value = value
+    
+    def set(self, value):
+        self.value = value
+    
+    def get(self):
+        return self.value
+
+
+def make_refresh_reader(log_dir):
+    """Reader with just the state refresh_recent_logs touches, displays stubbed out
+    
+    No text_widget is set, so an error inside the refresh fails the test instead of being shown.
+    """
+    return make_reader(
+        eve_log_dir=log_dir, log_extensions=(".txt", ".log"), max_days_old=100000, max_files_to_show=10,
+        all_log_entries=[], _displayed_log_entries=[], last_file_stats={}, last_file_hashes={},
+        _log_file_cache={}, _bounty_keys=set(), bounty_entries=[], bounty_amounts=array.array('q'),
+        total_bounty_isk=0, bounty_session_start=None, crab_bounty_entries=[], crab_session_active=False,
+        logger=None, concord_link_start=None, concord_countdown_active=False, concord_link_completed=False,
+        current_beacon_id=None, _timestamp_date=None, _timestamp_date_str=None,
+        _timestamp_cache={}, status_var=StubVar(), high_freq_var=StubVar(False),
+        root=types.SimpleNamespace(update=lambda: None),
+        display_combined_logs=lambda: None, update_bounty_display=lambda: None,
+        update_concord_display=lambda: None, scan_for_active_crab_beacons=lambda: None,
+        update_beacon_session_if_newer=lambda *args: None)
+
+
+def write_log(path, text, mode="a"):
+    with open(path, mode + "b") as f:
+        f.write(text.encode("utf-8"))
+
+
+def logged_lines(reader):
+    return sorted(entry[1] for entry in reader.all_log_entries)
+
+
+def test_grown_file_parses_only_new_lines():
+    """Appended lines are added to the entries and bounties without repeating the old ones"""
+    log_dir = tempfile.mkdtemp()
+    try:
+        log_file = Path(log_dir) / LOG_NAME
+        reader = make_refresh_reader(log_dir)
+        
+        write_log(log_file, BOUNTY_1, "w")
+        reader.refresh_recent_logs()
+        assert logged_lines(reader) == [BOUNTY_1]
+        assert reader.total_bounty_isk == 1000
+        
+        write_log(log_file, BOUNTY_2)
+        reader.refresh_recent_logs()
+        assert logged_lines(reader) == [BOUNTY_1, BOUNTY_2]
+        assert reader.total_bounty_isk == 3000
+        assert len(reader.bounty_entries) == 2
+        assert reader._log_file_cache[str(log_file)]['offset'] == os.path.getsize(log_file)
+    finally:
+        shutil.rmtree(log_dir)
+    print("✅ Grown file only parses the appended lines")
+
+
+def test_partial_line_completed_later():
+    """A line without its newline yet is shown, then re-read once complete with no duplicate bounty"""
+    log_dir = tempfile.mkdtemp()
+    try:
+        log_file = Path(log_dir) / LOG_NAME
+        reader = make_refresh_reader(log_dir)
+        
+        write_log(log_file, BOUNTY_1 + BOUNTY_2[:40], "w")
+        reader.refresh_recent_logs()
+        assert logged_lines(reader) == [BOUNTY_1, BOUNTY_2[:40]]
+        assert reader._log_file_cache[str(log_file)]['offset'] == len(BOUNTY_1)
+        
+        write_log(log_file, BOUNTY_2[40:])
+        reader.refresh_recent_logs()
+        assert logged_lines(reader) == [BOUNTY_1, BOUNTY_2]
+        
+        # A refresh with nothing new doesn't count the completed bounty again
+        os.utime(log_file, (1, 1))
+        reader.refresh_recent_logs()
+        assert logged_lines(reader) == [BOUNTY_1, BOUNTY_2]
+        assert reader.total_bounty_isk == 3000
+        assert len(reader.bounty_entries) == 2
+    finally:
+        shutil.rmtree(log_dir)
+    print("✅ Partial line is re-read once complete without a duplicate bounty")
+
+
+def test_shrunk_file_is_read_from_start():
+    """A file smaller than the last read offset is parsed again from the beginning"""
+    log_dir = tempfile.mkdtemp()
+    try:
+        log_file = Path(log_dir) / LOG_NAME
+        reader = make_refresh_reader(log_dir)
+        
+        write_log(log_file, BOUNTY_1 + BOUNTY_2, "w")
+        reader.refresh_recent_logs()
+        
+        write_log(log_file, "short\n", "w")
+        reader.refresh_recent_logs()
+        assert logged_lines(reader) == ["short\n"]
+        assert reader._log_file_cache[str(log_file)]['offset'] == len("short\n")
+    finally:
+        shutil.rmtree(log_dir)
+    print("✅ Shrunk file is read again from the start")
+
+
+def test_running_hash_matches_full_file_hash():
+    """The hash kept up to date from the appended bytes matches hashing the whole file"""
+    log_dir = tempfile.mkdtemp()
+    try:
+        log_file = Path(log_dir) / LOG_NAME
+        reader = make_refresh_reader(log_dir)
+        
+        write_log(log_file, BOUNTY_1 + "hé\r\n", "w")
+        reader.refresh_recent_logs()
+        assert reader.last_file_hashes[str(log_file)] == reader.calculate_file_hash(log_file)
+        
+        write_log(log_file, BOUNTY_2 + "partial")
+        reader.refresh_recent_logs()
+        assert reader.last_file_hashes[str(log_file)] == reader.calculate_file_hash(log_file)
+        
+        write_log(log_file, "short\n", "w")
+        reader.refresh_recent_logs()
+        assert reader.last_file_hashes[str(log_file)] == reader.calculate_file_hash(log_file)
+    finally:
+        shutil.rmtree(log_dir)
+    print("✅ Running hash matches the full file hash")
+
+
+def test_reset_bounties_stay_reset():
+    """Bounties already read before a reset aren't added back by later refreshes"""
+    log_dir = tempfile.mkdtemp()
+    askyesno = eve_log_reader.messagebox.askyesno
+    eve_log_reader.messagebox.askyesno = lambda *args: True
+    try:
+        log_file = Path(log_dir) / LOG_NAME
+        reader = make_refresh_reader(log_dir)
+        
+        write_log(log_file, BOUNTY_1, "w")
+        reader.refresh_recent_logs()
+        reader.reset_bounty_tracking()
+        assert reader.total_bounty_isk == 0
+        
+        write_log(log_file, BOUNTY_2)
+        reader.refresh_recent_logs()
+        assert reader.total_bounty_isk == 2000
+        assert [entry['isk_amount'] for entry in reader.bounty_entries] == [2000]
+    finally:
+        eve_log_reader.messagebox.askyesno = askyesno
+        shutil.rmtree(log_dir)
+    print("✅ Reset bounties aren't re-added by later refreshes")
+
+
+if __name__ == "__main__":
+    print("Testing incremental log refresh...")
+    print("=" * 50)
+    test_grown_file_parses_only_new_lines()
+    test_partial_line_completed_later()
+    test_shrunk_file_is_read_from_start()
+    test_running_hash_matches_full_file_hash()
+    test_reset_bounties_stay_reset()
+    print("=" * 50)
+    print("✅ All incremental refresh tests passed!")
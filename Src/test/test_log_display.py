@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test display_combined_logs: new entries are inserted at the top, anything else rebuilds the view
+Runs display_combined_logs against a recording text widget instead of the Tkinter UI
+"""
+
+from datetime import datetime, timezone
+
+from reader_helpers import make_reader
+
+
+class RecordingTextWidget:
+    """Stand-in for the Tk text widget that records its calls"""
+    def __init__(self):
+        self.calls = []
+    
+    def insert(self, index, text):
+        self.calls.append(("insert", index, text))
+    
+    def delete(self, start, end):
+        self.calls.append(("delete",))
+    
+    def see(self, index):
+        pass
+
+
+def entry(second, line):
+    return (datetime(2025, 1, 1, 12, 0, second, tzinfo=timezone.utc), line, "20250101_120000_123.txt")
+
+
+def test_new_entries_are_inserted_at_top():
+    """Entries added ahead of the ones on screen are inserted without a rebuild"""
+    old_entries = [entry(1, "second\n"), entry(0, "first\n")]
+    reader = make_reader(all_log_entries=old_entries, _displayed_log_entries=[], text_widget=RecordingTextWidget())
+    reader.display_combined_logs()
+    assert reader.text_widget.calls[0] == ("delete",)
+    
+    reader.text_widget.calls = []
+    reader.all_log_entries = [entry(2, "third\n")] + old_entries
+    reader.display_combined_logs()
+    assert reader.text_widget.calls == [("insert", "1.0", "[2025-01-01 12:00:02] [20250101_120000_123.txt] third\n")]
+    assert reader._displayed_log_entries == reader.all_log_entries
+    print("✅ New entries are inserted at the top")
+
+
+def test_changed_entries_rebuild_view():
+    """Entries that don't end with the ones on screen rebuild the whole view"""
+    reader = make_reader(all_log_entries=[entry(1, "second\n"), entry(0, "first\n")], _displayed_log_entries=[],
+                         text_widget=RecordingTextWidget())
+    reader.display_combined_logs()
+    
+    reader.text_widget.calls = []
+    reader.all_log_entries = [entry(2, "third\n"), entry(1, "second\n")]
+    reader.display_combined_logs()
+    assert reader.text_widget.calls[0] == ("delete",)
+    assert reader.text_widget.calls[1][2].count("\n") == 2
+    print("✅ Changed entries rebuild the view")
+
+
+def test_in_place_append_is_not_taken_as_displayed():
+    """Appending to all_log_entries in place doesn't change what's recorded as on screen"""
+    reader = make_reader(all_log_entries=[entry(0, "first\n")], _displayed_log_entries=[],
+                         text_widget=RecordingTextWidget())
+    reader.display_combined_logs()
+    
+    reader.all_log_entries.append(entry(1, "appended\n"))
+    assert reader._displayed_log_entries == [entry(0, "first\n")]
+    
+    # The appended entry isn't ahead of the displayed ones, so it needs a rebuild
+    reader.text_widget.calls = []
+    reader.display_combined_logs()
+    assert reader.text_widget.calls[0] == ("delete",)
+    print("✅ In-place append doesn't change the displayed entries")
+
+
+if __name__ == "__main__":
+    print("Testing log display...")
+    print("=" * 50)
+    test_new_entries_are_inserted_at_top()
+    test_changed_entries_rebuild_view()
+    test_in_place_append_is_not_taken_as_displayed()
+    print("=" * 50)
+    print("✅ All log display tests passed!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test timestamp extraction from log lines
+Runs extract_timestamp without the Tkinter UI
+"""
+
+from datetime import datetime, timezone
+
+import reader_helpers
+
+
+def make_reader():
+    """Create a reader with empty timestamp caches and a fixed 'now'"""
+    return reader_helpers.make_reader(
+        _timestamp_date=None,
+        _timestamp_date_str=None,
+        _timestamp_cache={},
+        get_utc_now=lambda: datetime(2025, 3, 1, 8, 30, 0, tzinfo=timezone.utc),
+    )
+
+
+def test_time_only_lines_use_todays_date():
+    """EVE game log lines only give HH:MM:SS, completed with today's UTC date"""
+    reader = make_reader()
+    
+    timestamp = reader.extract_timestamp("[ 2025.01.15 12:34:56 ] (combat) 50 from Hobgoblin - Hits\n")
+    assert timestamp == datetime(2025, 3, 1, 12, 34, 56, tzinfo=timezone.utc)
+
+
+def test_dated_timestamps_take_priority():
+    """Full dates are used even when a bare HH:MM:SS comes earlier in the line"""
+    reader = make_reader()
+    
+    assert reader.extract_timestamp("[2025-01-15 12:00:00] [combat.txt] hello\n") == datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+    assert reader.extract_timestamp("at 09:00:00 logged 2025-01-15 12:00:00\n") == datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def test_no_timestamp():
+    """Lines without a timestamp give None"""
+    reader = make_reader()
+    
+    assert reader.extract_timestamp("Listener: Some Pilot\n") is None
+    assert reader.extract_timestamp("") is None
+
+
+def test_truncated_time_is_not_a_timestamp():
+    """A line cut off mid-time (e.g. still being written) has no HH:MM:SS to give"""
+    reader = make_reader()
+    
+    assert reader.extract_timestamp("[ 2025.01.15 12:34:5") is None
+    assert reader.extract_timestamp("[ 2025.01.15 12:34:") is None
+    assert reader.extract_timestamp("[ 2025.01.15 12:34:56") == datetime(2025, 3, 1, 12, 34, 56, tzinfo=timezone.utc)
+
+
+def test_repeated_timestamps_share_cache():
+    """The same timestamp string is only parsed once"""
+    reader = make_reader()
+    
+    first = reader.extract_timestamp("[ 2025.01.15 12:00:00 ] (bounty) first\n")
+    second = reader.extract_timestamp("[ 2025.01.15 12:00:00 ] (bounty) second\n")
+    assert first is second
+    assert len(reader._timestamp_cache) == 1
+
+
+if __name__ == "__main__":
+    test_time_only_lines_use_todays_date()
+    test_dated_timestamps_take_priority()
+    test_no_timestamp()
+    test_truncated_time_is_not_a_timestamp()
+    test_repeated_timestamps_share_cache()
+    print("✅ All timestamp extraction tests passed!")